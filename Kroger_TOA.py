@@ -10,6 +10,7 @@ import requests
 import os
 import re
 import json
+import browser_pool
 
  
 
@@ -21,43 +22,40 @@ stop_words = set(stopwords.words('english'))
 # Make sure image directory exists
 os.makedirs("images", exist_ok=True)
 
+def render_page_html(page, url, wait_ms=5000):
+    # Navigate directly to target URL - we should already be logged in
+    # Use a less strict wait condition to avoid timeouts
+    page.goto(url, wait_until="domcontentloaded")
+    
+    # Wait longer for the page to stabilize
+    print("   Waiting for page to stabilize...")
+    page.wait_for_timeout(wait_ms * 2)  # Double the wait time for better stability
+    
+    # Check if we're still logged in
+    html = page.content()
+    if "Sign In" in html:
+        print("⚠️ Warning: Session appears to be logged out. You may need to re-authenticate.")
+    
+    return html
+
 def get_rendered_html(url, wait_ms=5000, user_data_dir=None):
-    if user_data_dir is None:
-        user_data_dir = os.path.expanduser("~/ChromeProfiles/kroger_clean_profile")
+    # The default Kroger profile is served by the process-wide browser pool
+    if browser_pool.uses_profile(user_data_dir):
+        return render_page_html(browser_pool.get_page(), url, wait_ms)
     
     with sync_playwright() as p:
-        # Use the same user_data_dir as in Kroger_login.py
         context = p.chromium.launch_persistent_context(
             user_data_dir=user_data_dir,
             headless=False,
-            executable_path="/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--start-maximized",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-infobars",
-                "--disable-web-security",
-            ]
+            executable_path=browser_pool.CHROME_PATH,
+            args=browser_pool.LAUNCH_ARGS,
         )
         
-        page = context.pages[0] if context.pages else context.new_page()
-        
-        # Navigate directly to target URL - we should already be logged in
-        # Use a less strict wait condition to avoid timeouts
-        page.goto(url, wait_until="domcontentloaded")
-        
-        # Wait longer for the page to stabilize
-        print("   Waiting for page to stabilize...")
-        page.wait_for_timeout(wait_ms * 2)  # Double the wait time for better stability
-        
-        # Check if we're still logged in
-        if "Sign In" in page.content():
-            print("⚠️ Warning: Session appears to be logged out. You may need to re-authenticate.")
-        
-        html = page.content()
-        context.close()
-        return html
+        try:
+            page = context.pages[0] if context.pages else context.new_page()
+            return render_page_html(page, url, wait_ms)
+        finally:
+            context.close()
 
 def save_image(url, out_dir="images", filename=None):
     try:
@@ -0,0 +1,146 @@
+"""
+Kroger Browser Pool
+
+Process-wide Playwright browser shared by the Kroger test scripts.
+
+Chrome locks a profile directory to one running instance, and launching a
+persistent context costs a few seconds, so the context on the Kroger profile
+is started on first use and reused by every caller in the process until exit.
+
+To share one Chrome across separate test processes, start it once with
+`python browser_pool.py` and set RMN_CDP_URL=http://localhost:9222 for the
+tests; they then connect over CDP instead of launching their own.
+"""
+
+import argparse
+import atexit
+import functools
+import os
+import subprocess
+import threading
+from playwright.sync_api import sync_playwright
+import chromium_args
+
+# Constants
+USER_DATA_DIR = os.path.expanduser("~/ChromeProfiles/kroger_clean_profile")
+CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--start-maximized",
+    "--no-sandbox",
+    "--disable-infobars",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    *chromium_args.SHM_ARGS,
+]
+
+# DevTools endpoint of a long-lived Chrome to attach to instead of launching one
+CDP_URL = os.environ.get("RMN_CDP_URL")
+CDP_PORT = 9222
+
+# Seconds to wait for Chrome to shut down before giving up on it
+CLOSE_TIMEOUT = 60
+
+@functools.lru_cache(maxsize=1)
+def _start():
+    """Start Playwright and the persistent context on the Kroger profile (once per process)"""
+    playwright = sync_playwright().start()
+    try:
+        if CDP_URL:
+            # The shared Chrome's default context is the one on its profile
+            context = playwright.chromium.connect_over_cdp(CDP_URL).contexts[0]
+        else:
+            context = playwright.chromium.launch_persistent_context(
+                user_data_dir=USER_DATA_DIR,
+                headless=False,
+                executable_path=CHROME_PATH,
+                args=LAUNCH_ARGS,
+            )
+    except Exception:
+        playwright.stop()
+        raise
+    return playwright, context
+
+def uses_profile(user_data_dir):
+    """Check whether a caller's profile directory is the one the pool runs on"""
+    return user_data_dir is None or os.path.abspath(user_data_dir) == os.path.abspath(USER_DATA_DIR)
+
+def get_context():
+    """Return the shared persistent context, launching Chrome on first use"""
+    return _start()[1]
+
+@functools.lru_cache(maxsize=1)
+def _own_page():
+    """Open a tab for this process in the shared Chrome (once per process)"""
+    return get_context().new_page()
+
+def get_page():
+    """
+    Return the tab this process drives
+    
+    Attached over CDP, every test process gets its own tab so they never
+    drive the same one at once; otherwise the window's first tab is used.
+    """
+    if CDP_URL:
+        return _own_page()
+    context = get_context()
+    return context.pages[0] if context.pages else context.new_page()
+
+def close(timeout=CLOSE_TIMEOUT):
+    """
+    Close the shared browser if it was started; safe to call more than once
+    
+    A Chrome that hangs while shutting down would otherwise keep this process
+    (and its memory) alive forever, so a watchdog hard-exits after `timeout`
+    seconds; the Playwright driver then kills the browser it launched.
+    """
+    if _start.cache_info().currsize == 0:
+        return
+    playwright, context = _start()
+    _start.cache_clear()
+    page = _own_page() if _own_page.cache_info().currsize else None
+    _own_page.cache_clear()
+    
+    watchdog = threading.Timer(timeout, os._exit, args=(1,))
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        if context.browser:
+            # Attached over CDP: close our tab, disconnect and leave the shared Chrome running
+            if page is not None:
+                page.close()
+            context.browser.close()
+        else:
+            context.close()
+    finally:
+        try:
+            playwright.stop()
+        finally:
+            watchdog.cancel()
+
+atexit.register(close)
+
+def serve(port=CDP_PORT, headless=False):
+    """Run Chrome on the Kroger profile with a DevTools port for tests to attach to"""
+    cmd = [
+        CHROME_PATH,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={USER_DATA_DIR}",
+        *LAUNCH_ARGS,
+    ]
+    if headless:
+        cmd.append("--headless=new")
+    
+    print(f"🟢 Chrome listening on http://localhost:{port} (export RMN_CDP_URL=http://localhost:{port})")
+    try:
+        subprocess.run(cmd, check=False)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a shared Chrome for the Kroger test scripts")
+    parser.add_argument("--port", type=int, default=CDP_PORT, help=f"DevTools port (default: {CDP_PORT})")
+    parser.add_argument("--headless", action="store_true", help="Run Chrome without a window")
+    args = parser.parse_args()
+    serve(args.port, args.headless)
@@ -0,0 +1,24 @@
+"""
+Chromium Args
+
+Command-line flag lists shared by the scripts that launch Chromium.
+"""
+
+import os
+
+# /dev/shm is only too small to rely on inside Docker; elsewhere it beats the /tmp fallback
+SHM_ARGS = ["--disable-dev-shm-usage"] if os.path.exists("/.dockerenv") else []
+
+# Flags for the throwaway Chromium the screenshot scripts launch
+SCREENSHOT_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-features=IsolateOrigins,site-per-process",
+    "--disable-ipc-flooding-protection",
+    "--mute-audio",
+    *SHM_ARGS,
+]
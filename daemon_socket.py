@@ -0,0 +1,106 @@
+"""
+Daemon Socket
+
+Unix socket plumbing shared by the screenshot scripts' --daemon mode.
+
+A client sends one JSON task per connection as a single line and the daemon
+answers with one JSON line once the task is done, e.g. {"ok": true, ...} or
+{"ok": false, "error": ...}.
+"""
+
+import json
+import os
+import socket
+import tempfile
+
+# Seconds a client waits for a daemon's reply by default; callers running the
+# scripts under their own timeout should pass a shorter one
+CLIENT_TIMEOUT = 300
+# Seconds to wait when checking whether a daemon is already listening
+PROBE_TIMEOUT = 1
+
+def runtime_dir():
+    """Per-user directory for the daemon sockets"""
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"rmn-{os.getuid()}")
+
+def default_path(name):
+    """Socket path for the daemon called `name`"""
+    return os.path.join(runtime_dir(), f"rmn-pw-{name}.sock")
+
+def encode(message):
+    """Frame a message as one JSON line"""
+    return (json.dumps(message) + "\n").encode()
+
+def decode(line):
+    """Parse one JSON line; None for an empty line (the peer hung up)"""
+    return json.loads(line) if line.strip() else None
+
+def is_listening(socket_path):
+    """Check whether a daemon accepts connections on the socket"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(PROBE_TIMEOUT)
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+def prepare(socket_path):
+    """
+    Get ready to bind a daemon socket
+
+    Creates the socket's directory (owner-only for the default runtime dir)
+    and removes a socket file left behind by a daemon that died, since it
+    would block bind(). Raises RuntimeError if a live daemon still answers.
+    """
+    directory = os.path.dirname(socket_path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if os.path.abspath(directory) == os.path.abspath(runtime_dir()) and os.stat(directory).st_uid != os.getuid():
+        raise RuntimeError(f"{directory} is owned by another user")
+
+    if os.path.exists(socket_path):
+        if is_listening(socket_path):
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        os.unlink(socket_path)
+
+def restrict(socket_path):
+    """Limit a freshly bound socket to its owner"""
+    os.chmod(socket_path, 0o600)
+
+def request(task, socket_path, timeout=CLIENT_TIMEOUT):
+    """
+    Hand a task to a running daemon and wait for its reply
+
+    Returns:
+        dict: The daemon's reply, or None if no daemon took the task
+
+    Raises:
+        TimeoutError: The task was sent but no reply came within `timeout`
+            seconds; the daemon may still be working on it, so callers must
+            not redo it themselves
+    """
+    if not os.path.exists(socket_path):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+            sock.sendall(encode(task))
+        except OSError:
+            return None
+
+        try:
+            with sock.makefile("rb") as response:
+                line = response.readline()
+        except TimeoutError:
+            raise TimeoutError(f"No reply from the daemon on {socket_path} within {timeout}s") from None
+        except OSError:
+            # The daemon went away mid-task
+            return None
+
+    try:
+        return decode(line)
+    except ValueError:
+        return None
@@ -8,6 +8,7 @@ It serves as the main entry point for ad extraction and provides shared utilitie
 from bs4 import BeautifulSoup
 from collections import Counter
 from playwright.sync_api import sync_playwright
+import browser_pool
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.util import ngrams
@@ -37,6 +38,7 @@ import requests
 import os
 import re
 import json
+import contextlib
 import importlib
 from pathlib import Path
 import sys, logging, datetime, json
@@ -62,6 +64,11 @@ def log(msg: str): logging.info(msg)
 log(f"Diagnostics dir: {DIAG_DIR}")
 log(f"Log file: {LOG_PATH}")
 
+def log_console(msg): log(f"[console] {msg.type}: {msg.text}")
+
+# Pages of the shared browser that already forward their console to the log
+_console_logged_pages = set()
+
 # Import ad extractors
 from ad_extractors import get_all_extractors, get_extractor
 
@@ -102,43 +109,56 @@ def get_rendered_html(url, wait_ms=5000, user_data_dir=None, keep_open=False):
     if user_data_dir is None:
         user_data_dir = os.path.expanduser("~/ChromeProfiles/kroger_clean_profile")
     
-    with sync_playwright() as p:
-        # Try to launch using Playwright's default browser first
-        try:
-            context = p.chromium.launch_persistent_context(
-                user_data_dir=user_data_dir,
-                headless=False,
-                viewport=None,  # critical for real window sizing
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--start-maximized",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-infobars",
-                    "--disable-web-security",
-                ]
-            )
-        except Exception as e:
-            print(f"Error launching browser with default settings: {e}")
-            print("Trying alternative browser launch method...")
-            # Fall back to using system Chrome if available
-            context = p.chromium.launch_persistent_context(
-                user_data_dir=user_data_dir,
-                headless=False,
-                viewport=None,  # critical for real window sizing
-                channel="chrome",  # Try using the system Chrome
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--start-maximized",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-infobars",
-                    "--disable-web-security",
-                ]
-            )
-        
-        page = context.pages[0] if context.pages else context.new_page()
-        page.on("console", lambda m: log(f"[console] {m.type}: {m.text}"))
+    # With RMN_CDP_URL set, attach to the long-lived Chrome shared by the tests
+    # when the caller wants its profile, as Kroger_TOA.get_rendered_html does
+    shared = browser_pool.CDP_URL is not None and browser_pool.uses_profile(user_data_dir)
+    with (contextlib.nullcontext() if shared else sync_playwright()) as p:
+        if shared:
+            context = browser_pool.get_context()
+        else:
+            # Try to launch using Playwright's default browser first
+            try:
+                context = p.chromium.launch_persistent_context(
+                    user_data_dir=user_data_dir,
+                    headless=False,
+                    viewport=None,  # critical for real window sizing
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--start-maximized",
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-infobars",
+                        "--disable-web-security",
+                    ]
+                )
+            except Exception as e:
+                print(f"Error launching browser with default settings: {e}")
+                print("Trying alternative browser launch method...")
+                # Fall back to using system Chrome if available
+                context = p.chromium.launch_persistent_context(
+                    user_data_dir=user_data_dir,
+                    headless=False,
+                    viewport=None,  # critical for real window sizing
+                    channel="chrome",  # Try using the system Chrome
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--start-maximized",
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-infobars",
+                        "--disable-web-security",
+                    ]
+                )
+            
+        if shared:
+            # The pool's page lives as long as the process, so hook its console once
+            page = browser_pool.get_page()
+            if page not in _console_logged_pages:
+                page.on("console", log_console)
+                _console_logged_pages.add(page)
+        else:
+            page = context.pages[0] if context.pages else context.new_page()
+            page.on("console", log_console)
         
         # Navigate directly to target URL - we should already be logged in
         # Use a less strict wait condition to avoid timeouts
@@ -483,7 +503,8 @@ def get_rendered_html(url, wait_ms=5000, user_data_dir=None, keep_open=False):
             except EOFError:
                 pass
         
-        context.close()
+        if not shared:
+            context.close()
         return html
 
 def extract_common_words_and_phrases(titles):
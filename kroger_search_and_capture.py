@@ -12,6 +12,7 @@ The captured HTML can be processed by process_saved_html.py to extract TOA data.
 """
 
 import os
+import sys
 from datetime import datetime
 import json
 import urllib.parse
@@ -160,24 +161,285 @@ def scroll_results(page, max_loops=120, step_ratio=0.85, sleep_ms=600):
         {"maxLoops": max_loops, "stepRatio": step_ratio, "sleepMs": sleep_ms},
     )
 
-def search_and_capture(search_term=None, output_dir=None):
-    """Test if the session persists between browser launches"""
+def capture_search_results(page, search_term, output_dir):
+    """Run one search on an already logged-in page and capture its results
+    
+    Returns True if the results page was captured, False otherwise.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    
+    # Step 3: Perform the search query
+    print("\n🔎 Step 3: Performing search...")
+    search_url = "https://www.kroger.com/search?query={}".format(urllib.parse.quote_plus(search_term))
+    
+    try:
+        # Use simpler wait conditions to avoid timeouts
+        page.goto(search_url, wait_until="domcontentloaded")
+        
+        # Short, "whichever happens first" readiness wait
+        print("   Waiting for page to be ready...")
+        try:
+            # Use Promise.race in JavaScript to implement "whichever happens first"
+            page.evaluate("""
+            async () => {
+                return await Promise.race([
+                    // Option 1: Wait for products to appear (up to 3s)
+                    new Promise(resolve => {
+                        const checkProducts = () => {
+                            const products = document.querySelectorAll('[data-testid*="product"], [class*="product-card"]');
+                            if (products.length > 0) {
+                                console.log(`Found ${products.length} products`); 
+                                resolve('products_found');
+                                return true;
+                            }
+                            return false;
+                        };
+                        
+                        // Check immediately
+                        if (checkProducts()) return;
+                        
+                        // Check every 300ms for 3s
+                        let attempts = 0;
+                        const interval = setInterval(() => {
+                            attempts++;
+                            if (checkProducts() || attempts >= 10) {
+                                clearInterval(interval);
+                                if (attempts >= 10) resolve('products_timeout');
+                            }
+                        }, 300);
+                    }),
+                    
+                    // Option 2: DOM is ready enough
+                    new Promise(resolve => {
+                        if (document.readyState === 'complete' || 
+                            document.querySelectorAll('body *').length > 50) {
+                            resolve('dom_ready');
+                        } else {
+                            window.addEventListener('DOMContentLoaded', () => resolve('dom_loaded'));
+                            // Backup timeout
+                            setTimeout(() => resolve('dom_timeout'), 3000);
+                        }
+                    })
+                ]);
+            }
+            """)
+            print("   Page is ready for scrolling")
+        except Exception as e:
+            print(f"   Readiness wait error: {e} - continuing anyway")
+            
+        # Log the page and frame information
+        print(f"page.url: {page.url}")
+        print("Frames:\n" + "\n".join([f"  - {f.url or '<no url>'}" for f in page.frames]))
+
+        # Product grid check already done above
+
+        # Create sanitized search term for filenames
+        safe_search_term = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in search_term)
+        
+        # Wait longer for the page to stabilize
+        print("   Waiting for page to stabilize...")
+        page.wait_for_timeout(10000)
+        
+        # Check if we're still logged in after search using selector-based check
+        is_still_logged_in = not page.is_visible("text=Sign In")
+        
+        if is_still_logged_in:
+            print("✅ Still logged in after search")
+        else:
+            print("❌ Session lost during search")
+            return False
+            
+        # Create search-specific filename with sanitized search term
+        # Note: We already created safe_search_term above, so we'll reuse it
+        file_prefix = f"search_results_{safe_search_term}_{timestamp}"
+        
+        # Create main and TOA subfolders if they don't exist
+        main_dir = os.path.join(output_dir, "main")
+        toa_dir = os.path.join(output_dir, "TOA")
+        os.makedirs(main_dir, exist_ok=True)
+        os.makedirs(toa_dir, exist_ok=True)
+        
+        # Use scroll_results to scroll the page before screenshot capture
+        print("   Scrolling page before screenshot...")
+        try:
+            # Scroll the page to load all content
+            scroll_result = scroll_results(page)
+            print(f"   Scrolling completed. Scrolled to Y={scroll_result['finalY']} of {scroll_result['finalH']}")
+        except Exception as e:
+            print(f"   Warning: Scrolling failed: {e}")
+        
+        # Take a screenshot of the search results and save in main subfolder
+        screenshot_path = os.path.join(main_dir, f"{file_prefix}.png")
+        page.screenshot(path=screenshot_path, full_page=True)
+        print("📷 Screenshot saved to {}".format(screenshot_path))
+        
+        # Check for TOA ads
+        toa_divs = page.query_selector_all('div[data-testid="StandardTOA"]')
+        print("🔍 Found {} TOA ads on the page".format(len(toa_divs)))
+        
+        # Use a single, comprehensive selector for the main carousel
+        # This prevents duplicate captures of the same carousel
+        carousel_selectors = [
+            'div.CuratedCarousel, div[class*="Carousel"]:has(.kds-Heading--xl)'  # Main carousel with heading
+        ]
+        
+        # Create carousel directory
+        carousel_dir = os.path.join(output_dir, "Carousel")
+        os.makedirs(carousel_dir, exist_ok=True)
+        
+        # Try each selector
+        carousel_count = 0
+        captured_carousel = False  # Flag to track if we've already captured a carousel
+        for selector in carousel_selectors:
+            # Skip if we've already captured a carousel
+            if captured_carousel:
+                break
+                
+            carousels = page.query_selector_all(selector)
+            if carousels:
+                print(f"🎠 Found {len(carousels)} carousel elements with selector: {selector}")
+                
+                for i, carousel in enumerate(carousels):
+                    try:
+                        # Inject CSS to hide sticky headers/filters before scrolling carousel into view
+                        page.add_style_tag(content="""
+                            header,
+                            .Header,
+                            .kds-Header,
+                            [data-testid="header"],
+                            .kds-StickyHeader,
+                            .SearchFilters,
+                            .search-page-filters,
+                            [class*="sticky"]
+                            {
+                              display: none !important;
+                            }
+                        """)
+                        # Scroll the carousel into view
+                        carousel.scroll_into_view_if_needed()
+                        
+                        # Wait a moment for any animations or lazy-loaded content
+                        page.wait_for_timeout(500)
+                        
+                        # Get carousel header text if available - expanded selector list
+                        header = carousel.query_selector(
+                            '.CuratedCarousel__header, h2, .header, .kds-Heading, .headerSection-header, [class*="header"], [class*="title"]'
+                        )
+                        
+                        # Skip carousels without headers only if we have multiple carousels
+                        if not header and len(carousels) > 1:
+                            print(f"⚠️ Skipping carousel {i+1} - no header found")
+                            continue
+                            
+                        # If no header found but this is the only carousel, proceed anyway
+                        header_text = header.text_content().strip() if header else "main_carousel"
+                        
+                        # Skip carousels with empty headers only if we have multiple carousels
+                        if not header_text and len(carousels) > 1:
+                            print(f"⚠️ Skipping carousel {i+1} - empty header text")
+                            continue
+                            
+                        # Generate filename
+                        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+                        safe_header = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in header_text.lower())
+                        safe_header = safe_header[:30]  # Limit length
+                        
+                        # Include search term in filename
+                        safe_search_term = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in search_term.lower())
+                        
+                        filename = f"carousel_{safe_header}_{safe_search_term}_{timestamp}.png"
+                        filepath = os.path.join(carousel_dir, filename)
+                        
+                        # Take screenshot of the entire carousel as a single image
+                        try:
+                            # Get bounding box
+                            box = carousel.bounding_box()
+                            pad = 16  # Add padding around the element
+                            
+                            # Create clip area with padding
+                            clip = {
+                                "x": max(0, box["x"] - pad),
+                                "y": max(0, box["y"] - pad),
+                                "width": min(page.viewport_size()["width"] - box["x"] + pad, box["width"] + 2 * pad),
+                                "height": box["height"] + 2 * pad
+                            }
+                            
+                            # Take screenshot with clip area - capturing the entire carousel
+                            page.screenshot(path=filepath, clip=clip)
+                            print(f"📸 Carousel screenshot saved to: {filepath}")
+                            carousel_count += 1
+                            captured_carousel = True  # Mark that we've captured a carousel
+                            
+                            # Break after capturing the first carousel
+                            break
+                            
+                        except Exception as e:
+                            print(f"❌ Error taking screenshot with padding: {e}")
+                            
+                            # Fallback: take direct element screenshot
+                            try:
+                                carousel.screenshot(path=filepath)
+                                print(f"📸 Carousel screenshot saved to: {filepath} (direct method)")
+                                carousel_count += 1
+                                captured_carousel = True  # Mark that we've captured a carousel
+                                break  # Break after capturing the first carousel
+                            except Exception as e2:
+                                print(f"❌ Error taking direct screenshot: {e2}")
+                    
+                    except Exception as e:
+                        print(f"❌ Error processing carousel {i+1}: {e}")
+        
+        if carousel_count == 0:
+            print("⚠️ No carousels found or captured")
+        else:
+            print(f"✅ Successfully captured {carousel_count} carousel(s)")
+        
+        # Save HTML content to file
+        html_path = os.path.join(output_dir, f"{file_prefix}.html")
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(page.content())
+        print("💾 HTML saved to {}".format(html_path))
+        
+        # Process the HTML file to extract TOAs with search term
+        try:
+            from process_saved_html import extract_ads_from_html_file
+            # Pass the HTML file path to ensure only this run's results are processed for images
+            extract_ads_from_html_file(html_path, process_images_for_html=html_path)
+        except Exception as e:
+            print(f"   Note: Could not process HTML file immediately: {e}")
+        
+    except (TimeoutError, ConnectionError) as e:
+        print("❌ Network or timeout error during search test: {}".format(e))
+        return False
+    except (ValueError, TypeError) as e:
+        print("❌ Value or type error during search test: {}".format(e))
+        return False
+    except RuntimeError as e:
+        print("❌ Runtime error during search test: {}".format(e))
+        return False
+    except Exception as e:
+        print("❌ Unexpected error during search test: {}".format(e))
+        return False
+    
+    return True
+
+def search_and_capture(search_term=None, output_dir=None, search_terms=None):
+    """Log in once and capture results for one or more search terms"""
     print("\n" + "="*50)
     print("KROGER SEARCH AND CAPTURE")
     print("="*50)
     
     # Use default search term if none provided
-    if search_term is None:
-        search_term = DEFAULT_SEARCH_TERM
+    if not search_terms:
+        search_terms = [search_term if search_term is not None else DEFAULT_SEARCH_TERM]
     
     # Use default output directory if none provided
     if output_dir is None:
         output_dir = DEFAULT_OUTPUT_DIR
         
-    print(f"Search term: {search_term}")
+    print(f"Search terms: {', '.join(search_terms)}")
     print(f"Output directory: {output_dir}")
     
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     os.makedirs(output_dir, exist_ok=True)
     
     # Step 1: Check if cookies exist
@@ -295,261 +557,29 @@ def search_and_capture(search_term=None, output_dir=None):
                 context.close()
                 return False
         
-        # Step 3: Perform the search query
-        print("\n🔎 Step 3: Performing search...")
-        search_url = "https://www.kroger.com/search?query={}".format(urllib.parse.quote_plus(search_term))
-        
-        try:
-            # Use simpler wait conditions to avoid timeouts
-            page.goto(search_url, wait_until="domcontentloaded")
-            
-            # Short, "whichever happens first" readiness wait
-            print("   Waiting for page to be ready...")
-            try:
-                # Use Promise.race in JavaScript to implement "whichever happens first"
-                page.evaluate("""
-                async () => {
-                    return await Promise.race([
-                        // Option 1: Wait for products to appear (up to 3s)
-                        new Promise(resolve => {
-                            const checkProducts = () => {
-                                const products = document.querySelectorAll('[data-testid*="product"], [class*="product-card"]');
-                                if (products.length > 0) {
-                                    console.log(`Found ${products.length} products`); 
-                                    resolve('products_found');
-                                    return true;
-                                }
-                                return false;
-                            };
-                            
-                            // Check immediately
-                            if (checkProducts()) return;
-                            
-                            // Check every 300ms for 3s
-                            let attempts = 0;
-                            const interval = setInterval(() => {
-                                attempts++;
-                                if (checkProducts() || attempts >= 10) {
-                                    clearInterval(interval);
-                                    if (attempts >= 10) resolve('products_timeout');
-                                }
-                            }, 300);
-                        }),
-                        
-                        // Option 2: DOM is ready enough
-                        new Promise(resolve => {
-                            if (document.readyState === 'complete' || 
-                                document.querySelectorAll('body *').length > 50) {
-                                resolve('dom_ready');
-                            } else {
-                                window.addEventListener('DOMContentLoaded', () => resolve('dom_loaded'));
-                                // Backup timeout
-                                setTimeout(() => resolve('dom_timeout'), 3000);
-                            }
-                        })
-                    ]);
-                }
-                """)
-                print("   Page is ready for scrolling")
-            except Exception as e:
-                print(f"   Readiness wait error: {e} - continuing anyway")
-                
-            # Log the page and frame information
-            print(f"page.url: {page.url}")
-            print("Frames:\n" + "\n".join([f"  - {f.url or '<no url>'}" for f in page.frames]))
-
-            # Product grid check already done above
-
-            # Create sanitized search term for filenames
-            safe_search_term = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in search_term)
-            
-            # Wait longer for the page to stabilize
-            print("   Waiting for page to stabilize...")
-            page.wait_for_timeout(10000)
-            
-            # Check if we're still logged in after search using selector-based check
-            is_still_logged_in = not page.is_visible("text=Sign In")
-            
-            if is_still_logged_in:
-                print("✅ Still logged in after search")
-            else:
-                print("❌ Session lost during search")
-                context.close()
-                return False
-                
-            # Create search-specific filename with sanitized search term
-            # Note: We already created safe_search_term above, so we'll reuse it
-            file_prefix = f"search_results_{safe_search_term}_{timestamp}"
-            
-            # Create main and TOA subfolders if they don't exist
-            main_dir = os.path.join(output_dir, "main")
-            toa_dir = os.path.join(output_dir, "TOA")
-            os.makedirs(main_dir, exist_ok=True)
-            os.makedirs(toa_dir, exist_ok=True)
-            
-            # Use scroll_results to scroll the page before screenshot capture
-            print("   Scrolling page before screenshot...")
-            try:
-                # Scroll the page to load all content
-                scroll_result = scroll_results(page)
-                print(f"   Scrolling completed. Scrolled to Y={scroll_result['finalY']} of {scroll_result['finalH']}")
-            except Exception as e:
-                print(f"   Warning: Scrolling failed: {e}")
-            
-            # Take a screenshot of the search results and save in main subfolder
-            screenshot_path = os.path.join(main_dir, f"{file_prefix}.png")
-            page.screenshot(path=screenshot_path, full_page=True)
-            print("📷 Screenshot saved to {}".format(screenshot_path))
-            
-            # Check for TOA ads
-            toa_divs = page.query_selector_all('div[data-testid="StandardTOA"]')
-            print("🔍 Found {} TOA ads on the page".format(len(toa_divs)))
-            
-            # Use a single, comprehensive selector for the main carousel
-            # This prevents duplicate captures of the same carousel
-            carousel_selectors = [
-                'div.CuratedCarousel, div[class*="Carousel"]:has(.kds-Heading--xl)'  # Main carousel with heading
-            ]
-            
-            # Create carousel directory
-            carousel_dir = os.path.join(output_dir, "Carousel")
-            os.makedirs(carousel_dir, exist_ok=True)
-            
-            # Try each selector
-            carousel_count = 0
-            captured_carousel = False  # Flag to track if we've already captured a carousel
-            for selector in carousel_selectors:
-                # Skip if we've already captured a carousel
-                if captured_carousel:
-                    break
-                    
-                carousels = page.query_selector_all(selector)
-                if carousels:
-                    print(f"🎠 Found {len(carousels)} carousel elements with selector: {selector}")
-                    
-                    for i, carousel in enumerate(carousels):
-                        try:
-                            # Inject CSS to hide sticky headers/filters before scrolling carousel into view
-                            page.add_style_tag(content="""
-                                header,
-                                .Header,
-                                .kds-Header,
-                                [data-testid="header"],
-                                .kds-StickyHeader,
-                                .SearchFilters,
-                                .search-page-filters,
-                                [class*="sticky"]
-                                {
-                                  display: none !important;
-                                }
-                            """)
-                            # Scroll the carousel into view
-                            carousel.scroll_into_view_if_needed()
-                            
-                            # Wait a moment for any animations or lazy-loaded content
-                            page.wait_for_timeout(500)
-                            
-                            # Get carousel header text if available - expanded selector list
-                            header = carousel.query_selector(
-                                '.CuratedCarousel__header, h2, .header, .kds-Heading, .headerSection-header, [class*="header"], [class*="title"]'
-                            )
-                            
-                            # Skip carousels without headers only if we have multiple carousels
-                            if not header and len(carousels) > 1:
-                                print(f"⚠️ Skipping carousel {i+1} - no header found")
-                                continue
-                                
-                            # If no header found but this is the only carousel, proceed anyway
-                            header_text = header.text_content().strip() if header else "main_carousel"
-                            
-                            # Skip carousels with empty headers only if we have multiple carousels
-                            if not header_text and len(carousels) > 1:
-                                print(f"⚠️ Skipping carousel {i+1} - empty header text")
-                                continue
-                                
-                            # Generate filename
-                            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                            safe_header = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in header_text.lower())
-                            safe_header = safe_header[:30]  # Limit length
-                            
-                            # Include search term in filename
-                            safe_search_term = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in search_term.lower())
-                            
-                            filename = f"carousel_{safe_header}_{safe_search_term}_{timestamp}.png"
-                            filepath = os.path.join(carousel_dir, filename)
-                            
-                            # Take screenshot of the entire carousel as a single image
-                            try:
-                                # Get bounding box
-                                box = carousel.bounding_box()
-                                pad = 16  # Add padding around the element
-                                
-                                # Create clip area with padding
-                                clip = {
-                                    "x": max(0, box["x"] - pad),
-                                    "y": max(0, box["y"] - pad),
-                                    "width": min(page.viewport_size()["width"] - box["x"] + pad, box["width"] + 2 * pad),
-                                    "height": box["height"] + 2 * pad
-                                }
-                                
-                                # Take screenshot with clip area - capturing the entire carousel
-                                page.screenshot(path=filepath, clip=clip)
-                                print(f"📸 Carousel screenshot saved to: {filepath}")
-                                carousel_count += 1
-                                captured_carousel = True  # Mark that we've captured a carousel
-                                
-                                # Break after capturing the first carousel
-                                break
-                                
-                            except Exception as e:
-                                print(f"❌ Error taking screenshot with padding: {e}")
-                                
-                                # Fallback: take direct element screenshot
-                                try:
-                                    carousel.screenshot(path=filepath)
-                                    print(f"📸 Carousel screenshot saved to: {filepath} (direct method)")
-                                    carousel_count += 1
-                                    captured_carousel = True  # Mark that we've captured a carousel
-                                    break  # Break after capturing the first carousel
-                                except Exception as e2:
-                                    print(f"❌ Error taking direct screenshot: {e2}")
-                        
-                        except Exception as e:
-                            print(f"❌ Error processing carousel {i+1}: {e}")
-            
-            if carousel_count == 0:
-                print("⚠️ No carousels found or captured")
-            else:
-                print(f"✅ Successfully captured {carousel_count} carousel(s)")
-            
-            # Save HTML content to file
-            html_path = os.path.join(output_dir, f"{file_prefix}.html")
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(page.content())
-            print("💾 HTML saved to {}".format(html_path))
-            
-            # Process the HTML file to extract TOAs with search term
+        # Step 3: Perform the search queries, reusing this browser session
+        # Counted per search rather than per term, so repeated terms are not collapsed
+        succeeded = 0
+        for i, term in enumerate(search_terms, 1):
+            if len(search_terms) > 1:
+                print(f"\n[{i}/{len(search_terms)}] Search term: {term}")
+            if capture_search_results(page, term, output_dir):
+                succeeded += 1
+                continue
             try:
-                from process_saved_html import extract_ads_from_html_file
-                # Pass the HTML file path to ensure only this run's results are processed for images
-                extract_ads_from_html_file(html_path, process_images_for_html=html_path)
-            except Exception as e:
-                print(f"   Note: Could not process HTML file immediately: {e}")
-            
-        except (TimeoutError, ConnectionError) as e:
-            print("❌ Network or timeout error during search test: {}".format(e))
-            context.close()
-            return False
-        except (ValueError, TypeError) as e:
-            print("❌ Value or type error during search test: {}".format(e))
-            context.close()
-            return False
-        except RuntimeError as e:
-            print("❌ Runtime error during search test: {}".format(e))
-            context.close()
-            return False
-        except Exception as e:
-            print("❌ Unexpected error during search test: {}".format(e))
+                session_lost = page.is_visible("text=Sign In")
+            except PWError as e:
+                # The page or browser crashed; later searches would fail the same way
+                print(f"❌ Browser unavailable ({e}) - skipping remaining search terms")
+                break
+            if session_lost:
+                # The session is gone, so the remaining searches would fail too
+                print("❌ Session lost - skipping remaining search terms")
+                break
+        
+        print(f"SEARCH_SUMMARY: {succeeded}/{len(search_terms)}")
+        
+        if succeeded == 0:
             context.close()
             return False
         
@@ -567,13 +597,22 @@ if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Kroger search and capture script")
     parser.add_argument("--search", "-s", type=str, help="Search term to use")
+    parser.add_argument("--search-file", "-f", type=str, help="File with one search term per line (runs all in one browser session)")
     parser.add_argument("--output-dir", "-o", type=str, help="Output directory for results")
     args = parser.parse_args()
     
+    search_terms = None
+    if args.search_file:
+        with open(args.search_file, "r", encoding="utf-8") as f:
+            search_terms = [line.strip() for line in f if line.strip()]
+    
     # Run the search and capture function
-    success = search_and_capture(args.search, args.output_dir)
+    success = search_and_capture(args.search, args.output_dir, search_terms=search_terms)
     
     if success:
         print("\n✅ SEARCH AND CAPTURE COMPLETED SUCCESSFULLY")
     else:
         print("\n❌ SEARCH AND CAPTURE FAILED")
+    
+    # Non-zero exit so the scheduler can tell a run where every search failed
+    sys.exit(0 if success else 1)
@@ -26,6 +26,7 @@ except ImportError:
 
 # Constants
 DEFAULT_DIR = "output"
+TOA_IMAGE_TIMEOUT = 60  # seconds allowed for screenshot_toa_image.py
 
 def extract_toa_images(json_file, html_file=None, client_name=None):
     """
@@ -45,6 +46,9 @@ def extract_toa_images(json_file, html_file=None, client_name=None):
         # Build command to run screenshot_toa_image.py
         cmd = ["python3", "screenshot_toa_image.py", "--json", json_file]
         
+        # Give up on a busy daemon before this call's own timeout kills the script
+        cmd.extend(["--daemon-timeout", str(TOA_IMAGE_TIMEOUT - 10)])
+        
         # Add HTML file if provided
         if html_file:
             cmd.extend(["--html", html_file])  # Using --html flag (short form is -f)
@@ -65,7 +69,7 @@ def extract_toa_images(json_file, html_file=None, client_name=None):
                                   stdout=subprocess.PIPE, 
                                   stderr=subprocess.PIPE,
                                   text=True,
-                                  timeout=60)  # 60 second timeout
+                                  timeout=TOA_IMAGE_TIMEOUT)
             
             if result.returncode == 0:
                 print(f"✅ TOA image extraction completed successfully")
@@ -74,7 +78,7 @@ def extract_toa_images(json_file, html_file=None, client_name=None):
                 print(f"⚠️ TOA image extraction completed with issues: {result.stderr}")
                 return True  # Still return True to continue processing
         except subprocess.TimeoutExpired:
-            print(f"⚠️ TOA image extraction timed out after 60 seconds, continuing anyway")
+            print(f"⚠️ TOA image extraction timed out after {TOA_IMAGE_TIMEOUT} seconds, continuing anyway")
             return True  # Continue processing even if timeout occurs
     except Exception as e:
         print(f"❌ Error starting TOA image extraction: {e}")
@@ -7,28 +7,103 @@ executing scraping tasks at the specified times for each client.
 """
 
 import os
+import re
 import sys
 import json
 import time
+import atexit
+import signal
 import logging
+import logging.handlers
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
 import glob
 
+# Faster JSON parsing when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Final line printed by kroger_search_and_capture.py, e.g. "SEARCH_SUMMARY: 3/4"
+SEARCH_SUMMARY_RE = re.compile(r'^SEARCH_SUMMARY: (\d+)/\d+$', re.MULTILINE)
+
+# Matches the folder-name sanitization used by keyword_input.py
+# (\w is the regex equivalent of str.isalnum() plus underscore)
+_SANITIZE_RE = re.compile(r'[^\w-]')
+
+
+def sanitize_folder_name(name):
+    """Convert a client name to the folder name used under output/"""
+    return _SANITIZE_RE.sub('_', name)
+
+
+class _LazyJoin:
+    """Space-join a command list only if a log record is actually formatted"""
+    
+    def __init__(self, parts):
+        self.parts = parts
+        
+    def __str__(self):
+        return ' '.join(self.parts)
+
+
+def parse_12h_time(hour_str, minute_str, ampm):
+    """Convert a ("9", "45", "AM") schedule entry to a 24-hour (hour, minute) tuple"""
+    hour = int(hour_str)
+    if ampm == "PM" and hour < 12:
+        hour += 12
+    elif ampm == "AM" and hour == 12:
+        hour = 0
+    return hour, int(minute_str)
+
+
+def kill_process_group(proc):
+    """Kill a child started with start_new_session=True along with everything it spawned"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def load_json_file(path):
+    """Read a JSON file as bytes and parse it, using orjson when installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
 class SchedulerDaemon:
     def __init__(self):
         """Initialize the scheduler daemon"""
         self.project_root = Path(__file__).resolve().parent
         self.output_dir = self.project_root / "output"
+        self.history_file = self.output_dir / "client_history.json"
         self.running = False
-        self.threads = {}
-        self.last_run_times = {}  # Track last run times to avoid duplicates
+        self.wakeup = threading.Event()  # Set by stop() to interrupt the monitor wait
+        self.futures = {}  # thread_key -> Future of the running scrape
+        self.pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="scrape")
+        self.procs = set()  # Child processes still running, killed by stop()
+        self.procs_lock = threading.Lock()
+        self.schedule_entries = {}  # schedule_file -> (client_dir, client_dir_name)
+        self.schedule_configs = {}  # schedule_file -> (mtime_ns, prepared config)
+        self.history_mtime = None
+        self.sanitized_history = {}  # sanitized folder name -> keywords
+        self.last_run_times = OrderedDict()  # Track last run times to avoid duplicates (oldest first)
+        self.state_file = self.project_root / "logs" / "scheduler_state.json"
         
         # Set up logging
         self.setup_logging()
         
+        # Restore run keys so a restart within a scheduled minute does not fire twice
+        self.load_run_state()
+        
     def setup_logging(self):
         """Set up comprehensive logging for the daemon"""
         log_dir = self.project_root / "logs"
@@ -66,9 +141,46 @@ class SchedulerDaemon:
         )
         execution_handler.setFormatter(execution_formatter)
         
-        self.execution_logger.addHandler(execution_handler)
+        # Buffer the DEBUG chatter and write it out in batches; INFO and above
+        # (SCRAPE_START/SCRAPE_DONE markers, errors) flush immediately so a
+        # killed daemon loses at most some debug detail
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.INFO,
+            target=execution_handler,
+            flushOnClose=True
+        )
+        atexit.register(memory_handler.flush)
+        
+        self.execution_logger.addHandler(memory_handler)
         self.execution_logger.propagate = False  # Don't propagate to root logger
         
+    def load_run_state(self):
+        """Restore last_run_times from the state file written by save_run_state"""
+        try:
+            state = load_json_file(self.state_file)
+            entries = sorted(
+                (datetime.fromisoformat(value), key) for key, value in state.items()
+            )
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, IOError, ValueError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable scheduler state {self.state_file}: {e}")
+            return
+            
+        self.last_run_times = OrderedDict((key, run_time) for run_time, key in entries)
+        self.execution_logger.debug("RUN_STATE_LOADED: %s entries", len(self.last_run_times))
+        
+    def save_run_state(self):
+        """Atomically persist last_run_times so restarts keep duplicate-run protection"""
+        state = {key: run_time.isoformat() for key, run_time in self.last_run_times.items()}
+        tmp_file = self.state_file.with_suffix(".tmp")
+        try:
+            tmp_file.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp_file, self.state_file)
+        except OSError as e:
+            self.logger.error(f"Failed to save scheduler state: {e}")
+            
     def find_all_client_schedules(self):
         """Find all client schedule configuration files"""
         self.execution_logger.debug("FUNCTION_ENTRY: find_all_client_schedules()")
@@ -86,13 +198,32 @@ class SchedulerDaemon:
         self.execution_logger.debug(f"FOUND_SCHEDULE_FILES: {len(schedule_files)} files - {schedule_files}")
         return schedule_files
         
+    def prepare_schedule_config(self, config):
+        """Precompute the scheduled days and 24-hour (hour, minute) times on a config"""
+        times_24h = []
+        for entry in config.get("times", []):
+            try:
+                times_24h.append(parse_12h_time(*entry))
+            except (ValueError, TypeError):
+                continue
+        config["_days_set"] = frozenset(config.get("days", []))
+        config["_times_24h_set"] = frozenset(times_24h)
+        return config
+        
     def load_schedule_config(self, config_file):
         """Load a schedule configuration from file"""
         self.execution_logger.debug(f"FUNCTION_ENTRY: load_schedule_config({config_file})")
         try:
+            # Reuse the parsed config while the file is unchanged
+            mtime = os.stat(config_file).st_mtime_ns
+            cached = self.schedule_configs.get(config_file)
+            if cached and cached[0] == mtime:
+                self.execution_logger.debug(f"CONFIG_CACHE_HIT: {config_file}")
+                return cached[1]
+                
             self.execution_logger.debug(f"FILE_READ_ATTEMPT: {config_file}")
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self.prepare_schedule_config(load_json_file(config_file))
+            self.schedule_configs[config_file] = (mtime, config)
             self.execution_logger.debug(f"CONFIG_LOADED_SUCCESS: {config}")
             return config
         except (json.JSONDecodeError, IOError) as e:
@@ -100,75 +231,109 @@ class SchedulerDaemon:
             self.logger.error(f"Failed to load schedule config {config_file}: {e}")
             return None
             
+    def get_schedule_entry(self, schedule_file):
+        """Return the cached (client_dir, client_dir_name) for a schedule file"""
+        entry = self.schedule_entries.get(schedule_file)
+        if entry is None:
+            client_dir = Path(schedule_file).parent
+            entry = (client_dir, client_dir.name)
+            self.schedule_entries[schedule_file] = entry
+        return entry
+            
     def load_client_keywords(self, client_dir):
         """Load keywords for a client from their history"""
-        history_file = self.project_root / "output" / "client_history.json"
+        history_file = self.history_file
         
-        if not history_file.exists():
+        try:
+            mtime = history_file.stat().st_mtime_ns
+        except OSError:
             return []
             
-        try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
+        # Rebuild the sanitized-name index only when the history file changes
+        if mtime != self.history_mtime:
+            try:
+                history = load_json_file(history_file)
+            except (json.JSONDecodeError, IOError) as e:
+                self.logger.error(f"Failed to load client history: {e}")
+                return []
                 
-            # Extract client name from directory path
-            client_name = Path(client_dir).name
-            
-            # Try to find matching client in history
+            sanitized_history = {}
             for client, keywords in history.items():
-                # Create sanitized folder name to match
-                sanitized = ''.join(c if c.isalnum() or c in ['-', '_'] else '_' for c in client)
-                if sanitized == client_name:
-                    return keywords
-                    
-        except (json.JSONDecodeError, IOError) as e:
-            self.logger.error(f"Failed to load client history: {e}")
+                # First match wins, as with the previous linear scan
+                sanitized_history.setdefault(sanitize_folder_name(client), keywords)
+            self.sanitized_history = sanitized_history
+            self.history_mtime = mtime
             
-        return []
+        # Extract client name from directory path
+        client_name = client_dir.name if isinstance(client_dir, Path) else Path(client_dir).name
+        return self.sanitized_history.get(client_name, [])
         
     def is_scheduled_time(self, schedule_config):
         """Check if current time matches any scheduled time"""
+        # Configs from load_schedule_config carry precomputed lookups
+        if "_days_set" not in schedule_config:
+            self.prepare_schedule_config(schedule_config)
+            
         now = datetime.now()
-        current_hour = now.hour
-        current_minute = now.minute
         current_day = now.strftime("%A")
         
-        # Check if today is a scheduled day
-        scheduled_days = schedule_config.get("days", [])
-        if current_day not in scheduled_days:
-            return False
-            
-        # Check each scheduled time
-        times = schedule_config.get("times", [])
-        for hour_str, minute_str, ampm in times:
-            try:
-                hour_12 = int(hour_str)
-                minute = int(minute_str)
-                
-                # Convert to 24-hour format
-                scheduled_hour = hour_12
-                if ampm == "PM" and hour_12 < 12:
-                    scheduled_hour += 12
-                elif ampm == "AM" and hour_12 == 12:
-                    scheduled_hour = 0
-                    
-                # Check if it's time to run (within a 1-minute window)
-                if current_hour == scheduled_hour and current_minute == minute:
-                    return True
-                    
-            except (ValueError, TypeError):
-                continue
-                
-        return False
+        # Check if today is a scheduled day and the current minute is a scheduled time
+        return (
+            current_day in schedule_config["_days_set"]
+            and (now.hour, now.minute) in schedule_config["_times_24h_set"]
+        )
         
     def create_run_key(self, client_name, schedule_time):
         """Create a unique key for tracking run times"""
         now = datetime.now()
         return f"{client_name}_{now.strftime('%Y-%m-%d_%H:%M')}"
         
+    def run_streaming_subprocess(self, cmd, timeout, tail_lines=50):
+        """Run a command, streaming its combined output and keeping only the last lines"""
+        tail = deque(maxlen=tail_lines)
+        timed_out = threading.Event()
+        
+        # Own process group, so a timeout also kills the grandchildren (e.g. the
+        # Playwright driver) that hold the output pipe open
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            start_new_session=True
+        ) as proc:
+            with self.procs_lock:
+                if not self.running:
+                    # stop() already ran; don't leave a child behind it
+                    kill_process_group(proc)
+                self.procs.add(proc)
+            
+            def kill_on_timeout():
+                timed_out.set()
+                kill_process_group(proc)
+                
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.daemon = True
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    tail.append(line.rstrip("\n"))
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                with self.procs_lock:
+                    self.procs.discard(proc)
+                
+        output = "\n".join(tail)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+        return subprocess.CompletedProcess(cmd, returncode, stdout=output)
+        
     def run_scraper_for_client(self, client_name, client_dir, keywords):
         """Run the scraper for a specific client"""
-        self.execution_logger.debug(f"FUNCTION_ENTRY: run_scraper_for_client(client={client_name}, dir={client_dir}, keywords={keywords})")
+        self.execution_logger.debug("FUNCTION_ENTRY: run_scraper_for_client(client=%s, dir=%s, keywords=%s)", client_name, client_dir, keywords)
         
         try:
             self.logger.info(f"Starting scheduled scrape for client: {client_name}")
@@ -177,57 +342,63 @@ class SchedulerDaemon:
             # Create keywords file for this run
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             keywords_file = Path(client_dir) / f"scheduled_keywords_{timestamp}.txt"
-            self.execution_logger.debug(f"KEYWORDS_FILE_CREATE: {keywords_file}")
+            self.execution_logger.debug("KEYWORDS_FILE_CREATE: %s", keywords_file)
             
-            with open(keywords_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(keywords))
-            self.execution_logger.debug(f"KEYWORDS_FILE_WRITTEN: {len(keywords)} keywords")
+            # Encode once and hand the whole buffer to the kernel in a single write
+            data = ("\n".join(keywords) + "\n").encode("utf-8")
+            tmp_file = keywords_file.with_suffix(".tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            # Rename into place so readers never see a partially written file
+            os.replace(tmp_file, keywords_file)
+            self.execution_logger.debug("KEYWORDS_FILE_WRITTEN: %s keywords", len(keywords))
                 
-            # Run scraper for each keyword
+            # Run the scraper once for all keywords so the browser starts only once
             success_count = 0
-            for i, keyword in enumerate(keywords, 1):
-                self.execution_logger.info(f"KEYWORD_SCRAPE_START: [{i}/{len(keywords)}] '{keyword}'")
-                
-                cmd = [
-                    sys.executable,
-                    str(self.project_root / "kroger_search_and_capture.py"),
-                    "--search",
-                    keyword,
-                    "--output-dir",
-                    str(client_dir)
-                ]
+            timeout = 300 * len(keywords)  # 5 minutes per keyword
+            self.execution_logger.info(f"KEYWORD_SCRAPE_START: {len(keywords)} keywords in one session")
+            
+            cmd = [
+                sys.executable,
+                str(self.project_root / "kroger_search_and_capture.py"),
+                "--search-file",
+                str(keywords_file),
+                "--output-dir",
+                str(client_dir)
+            ]
+            
+            self.execution_logger.debug("SUBPROCESS_CMD: %s", _LazyJoin(cmd))
+            
+            try:
+                self.execution_logger.debug("SUBPROCESS_START: kroger_search_and_capture.py for %s keywords", len(keywords))
+                result = self.run_streaming_subprocess(cmd, timeout=timeout)
                 
-                self.execution_logger.debug(f"SUBPROCESS_CMD: {' '.join(cmd)}")
+                self.execution_logger.debug("SUBPROCESS_RETURN_CODE: %s", result.returncode)
+                if result.stdout:
+                    self.execution_logger.debug("SUBPROCESS_OUTPUT_TAIL: %s", result.stdout)
                 
-                try:
-                    self.execution_logger.debug(f"SUBPROCESS_START: kroger_search_and_capture.py for '{keyword}'")
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=300  # 5 minute timeout per keyword
-                    )
+                summary = SEARCH_SUMMARY_RE.search(result.stdout or "")
+                if result.returncode == 0 and summary:
+                    success_count = int(summary.group(1))
                     
-                    self.execution_logger.debug(f"SUBPROCESS_RETURN_CODE: {result.returncode}")
-                    if result.stdout:
-                        self.execution_logger.debug(f"SUBPROCESS_STDOUT: {result.stdout[:500]}...")
-                    if result.stderr:
-                        self.execution_logger.debug(f"SUBPROCESS_STDERR: {result.stderr[:500]}...")
+                if success_count:
+                    self.logger.info(f"Successfully scraped {success_count}/{len(keywords)} keywords for {client_name}")
+                    self.execution_logger.info(f"KEYWORD_SCRAPE_SUCCESS: {success_count}/{len(keywords)}")
+                else:
+                    self.logger.error(f"Failed to scrape keywords for {client_name}: {result.stdout}")
+                    self.execution_logger.error(f"KEYWORD_SCRAPE_FAILED: {client_name} - {result.stdout}")
                     
-                    if result.returncode == 0:
-                        success_count += 1
-                        self.logger.info(f"Successfully scraped keyword '{keyword}' for {client_name}")
-                        self.execution_logger.info(f"KEYWORD_SCRAPE_SUCCESS: '{keyword}'")
-                    else:
-                        self.logger.error(f"Failed to scrape keyword '{keyword}' for {client_name}: {result.stderr}")
-                        self.execution_logger.error(f"KEYWORD_SCRAPE_FAILED: '{keyword}' - {result.stderr}")
-                        
-                except subprocess.TimeoutExpired:
-                    self.logger.error(f"Timeout scraping keyword '{keyword}' for {client_name}")
-                    self.execution_logger.error(f"KEYWORD_SCRAPE_TIMEOUT: '{keyword}' after 300s")
-                except Exception as e:
-                    self.logger.error(f"Error scraping keyword '{keyword}' for {client_name}: {e}")
-                    self.execution_logger.error(f"KEYWORD_SCRAPE_EXCEPTION: '{keyword}' - {e}")
+            except subprocess.TimeoutExpired:
+                self.logger.error(f"Timeout scraping keywords for {client_name}")
+                self.execution_logger.error(f"KEYWORD_SCRAPE_TIMEOUT: {client_name} after {timeout}s")
+            except Exception as e:
+                self.logger.error(f"Error scraping keywords for {client_name}: {e}")
+                self.execution_logger.error(f"KEYWORD_SCRAPE_EXCEPTION: {client_name} - {e}")
                     
             # Process HTML files
             self.execution_logger.info(f"HTML_PROCESSING_START: {client_dir}")
@@ -242,28 +413,24 @@ class SchedulerDaemon:
                     "--all-files"
                 ]
                 
-                self.execution_logger.debug(f"HTML_PROCESS_CMD: {' '.join(process_cmd)}")
-                self.execution_logger.debug(f"SUBPROCESS_START: process_saved_html.py")
+                self.execution_logger.debug("HTML_PROCESS_CMD: %s", _LazyJoin(process_cmd))
+                self.execution_logger.debug("SUBPROCESS_START: process_saved_html.py")
                 
-                result = subprocess.run(
+                result = self.run_streaming_subprocess(
                     process_cmd,
-                    capture_output=True,
-                    text=True,
                     timeout=120  # 2 minute timeout for processing
                 )
                 
-                self.execution_logger.debug(f"HTML_PROCESS_RETURN_CODE: {result.returncode}")
+                self.execution_logger.debug("HTML_PROCESS_RETURN_CODE: %s", result.returncode)
                 if result.stdout:
-                    self.execution_logger.debug(f"HTML_PROCESS_STDOUT: {result.stdout[:500]}...")
-                if result.stderr:
-                    self.execution_logger.debug(f"HTML_PROCESS_STDERR: {result.stderr[:500]}...")
+                    self.execution_logger.debug("HTML_PROCESS_OUTPUT_TAIL: %s", result.stdout)
                 
                 if result.returncode == 0:
                     self.logger.info(f"Successfully processed HTML files for {client_name}")
                     self.execution_logger.info(f"HTML_PROCESSING_SUCCESS: {client_name}")
                 else:
-                    self.logger.error(f"Failed to process HTML files for {client_name}: {result.stderr}")
-                    self.execution_logger.error(f"HTML_PROCESSING_FAILED: {client_name} - {result.stderr}")
+                    self.logger.error(f"Failed to process HTML files for {client_name}: {result.stdout}")
+                    self.execution_logger.error(f"HTML_PROCESSING_FAILED: {client_name} - {result.stdout}")
                     
             except Exception as e:
                 self.logger.error(f"Error processing HTML files for {client_name}: {e}")
@@ -287,39 +454,40 @@ class SchedulerDaemon:
                 
                 # Find all client schedule files
                 schedule_files = self.find_all_client_schedules()
-                self.execution_logger.debug(f"MONITOR_SCHEDULES_FOUND: {len(schedule_files)} schedule files")
+                self.execution_logger.debug("MONITOR_SCHEDULES_FOUND: %s schedule files", len(schedule_files))
                 
                 for schedule_file in schedule_files:
-                    self.execution_logger.debug(f"PROCESSING_SCHEDULE_FILE: {schedule_file}")
+                    self.execution_logger.debug("PROCESSING_SCHEDULE_FILE: %s", schedule_file)
                     
                     config = self.load_schedule_config(schedule_file)
                     if not config:
-                        self.execution_logger.debug(f"SKIPPING_INVALID_CONFIG: {schedule_file}")
+                        self.execution_logger.debug("SKIPPING_INVALID_CONFIG: %s", schedule_file)
                         continue
                         
                     # Extract client info
-                    client_dir = Path(schedule_file).parent
-                    client_name = config.get("client", client_dir.name)
-                    self.execution_logger.debug(f"CLIENT_INFO: name={client_name}, dir={client_dir}")
+                    client_dir, client_dir_name = self.get_schedule_entry(schedule_file)
+                    client_name = config.get("client", client_dir_name)
+                    self.execution_logger.debug("CLIENT_INFO: name=%s, dir=%s", client_name, client_dir)
                     
                     # Check if it's time to run
-                    self.execution_logger.debug(f"TIME_CHECK_START: {client_name}")
+                    self.execution_logger.debug("TIME_CHECK_START: %s", client_name)
                     if self.is_scheduled_time(config):
                         self.execution_logger.info(f"SCHEDULE_MATCH: {client_name} is scheduled to run now")
                         
                         run_key = self.create_run_key(client_name, datetime.now())
-                        self.execution_logger.debug(f"RUN_KEY_CREATED: {run_key}")
+                        self.execution_logger.debug("RUN_KEY_CREATED: %s", run_key)
                         
                         # Avoid duplicate runs within the same minute
                         if run_key in self.last_run_times:
-                            self.execution_logger.debug(f"DUPLICATE_RUN_PREVENTED: {run_key}")
+                            self.execution_logger.debug("DUPLICATE_RUN_PREVENTED: %s", run_key)
                             continue
                             
                         self.last_run_times[run_key] = datetime.now()
-                        self.execution_logger.debug(f"RUN_KEY_REGISTERED: {run_key}")
+                        self.save_run_state()
+                        self.execution_logger.debug("RUN_KEY_REGISTERED: %s", run_key)
                         
                         # Load keywords for this client
-                        self.execution_logger.debug(f"LOADING_KEYWORDS: {client_name}")
+                        self.execution_logger.debug("LOADING_KEYWORDS: %s", client_name)
                         keywords = self.load_client_keywords(client_dir)
                         if not keywords:
                             self.logger.warning(f"No keywords found for client {client_name}")
@@ -330,53 +498,59 @@ class SchedulerDaemon:
                             
                         # Start scraping in a separate thread
                         thread_key = f"{client_name}_{datetime.now().strftime('%H%M')}"
-                        self.execution_logger.debug(f"THREAD_KEY: {thread_key}")
+                        self.execution_logger.debug("THREAD_KEY: %s", thread_key)
                         
-                        if thread_key not in self.threads or not self.threads[thread_key].is_alive():
-                            self.execution_logger.info(f"THREAD_START: Creating new thread for {client_name}")
+                        if thread_key not in self.futures or self.futures[thread_key].done():
+                            self.execution_logger.info(f"THREAD_START: Submitting scrape for {client_name} to worker pool")
                             
-                            thread = threading.Thread(
-                                target=self.run_scraper_for_client,
-                                args=(client_name, client_dir, keywords),
-                                daemon=True
-                            )
-                            thread.start()
-                            self.threads[thread_key] = thread
+                            future = self.pool.submit(self.run_scraper_for_client, client_name, client_dir, keywords)
+                            self.futures[thread_key] = future
+                            # Drop the reference once the scrape finishes so the map stays small
+                            future.add_done_callback(lambda f, key=thread_key: self.futures.pop(key, None))
                             
-                            self.execution_logger.info(f"THREAD_CREATED: {thread_key} started successfully")
+                            self.execution_logger.info(f"THREAD_CREATED: {thread_key} submitted successfully")
                         else:
-                            self.execution_logger.debug(f"THREAD_ALREADY_RUNNING: {thread_key}")
+                            self.execution_logger.debug("THREAD_ALREADY_RUNNING: %s", thread_key)
                     else:
-                        self.execution_logger.debug(f"NO_SCHEDULE_MATCH: {client_name} not scheduled now")
+                        self.execution_logger.debug("NO_SCHEDULE_MATCH: %s not scheduled now", client_name)
                             
                 # Clean up old run time entries (keep only last hour)
+                # Entries are inserted in time order, so evict from the front only
                 cutoff_time = datetime.now().replace(minute=0, second=0, microsecond=0)
-                old_count = len(self.last_run_times)
-                self.last_run_times = {
-                    k: v for k, v in self.last_run_times.items() 
-                    if v >= cutoff_time
-                }
-                new_count = len(self.last_run_times)
+                removed = 0
+                while self.last_run_times and next(iter(self.last_run_times.values())) < cutoff_time:
+                    self.last_run_times.popitem(last=False)
+                    removed += 1
                 
-                if old_count != new_count:
-                    self.execution_logger.debug(f"CLEANUP_RUN_TIMES: Removed {old_count - new_count} old entries")
+                if removed:
+                    self.execution_logger.debug("CLEANUP_RUN_TIMES: Removed %s old entries", removed)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
                 self.execution_logger.error(f"MONITOR_LOOP_EXCEPTION: {e}")
                 
-            # Check every 30 seconds
-            self.execution_logger.debug("MONITOR_SLEEP: Waiting 30 seconds before next cycle")
-            time.sleep(30)
+            # Schedules have minute granularity, so wake once at the next minute boundary
+            now = time.time()
+            wait_seconds = 60 - (now % 60)
+            self.execution_logger.debug("MONITOR_SLEEP: Waiting %.1f seconds until next minute", wait_seconds)
+            self.wakeup.wait(wait_seconds)
             
     def start(self):
         """Start the scheduler daemon"""
         self.running = True
+        self.wakeup.clear()
         self.monitor_schedules()
         
     def stop(self):
         """Stop the scheduler daemon"""
         self.running = False
+        self.wakeup.set()
+        # Kill running scrapes rather than waiting up to their full timeout;
+        # their threads then finish on their own without starting new children
+        with self.procs_lock:
+            for proc in self.procs:
+                kill_process_group(proc)
+        self.pool.shutdown(wait=False, cancel_futures=True)
         self.logger.info("Scheduler daemon stopped")
 
 
@@ -384,6 +558,10 @@ def main():
     """Main entry point"""
     daemon = SchedulerDaemon()
     
+    # Treat SIGTERM (e.g. a plain `kill`) like Ctrl+C so the daemon stops cleanly
+    # and the buffered execution log is flushed at exit
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
     try:
         daemon.start()
     except KeyboardInterrupt:
@@ -10,18 +10,65 @@ import os
 import json
 import argparse
 import re
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import chromium_args
+import daemon_socket
 
 # Set up logging
 import logging
 import sys
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Constants
 DEFAULT_DIR = "output"
+DEFAULT_WORKERS = 4  # Browsers used when processing a results file
+
+# Playwright timeouts (ms); set RMN_PW_TIMEOUT_MS to allow slower navigation
+NAVIGATION_TIMEOUT_MS = int(os.environ.get("RMN_PW_TIMEOUT_MS", "10000"))
+ACTION_TIMEOUT_MS = 5000
+
+# Chromium flags for headless screenshotting. GPU stays enabled because
+# device_scale_factor rendering goes through Skia's GPU raster path.
+CHROMIUM_ARGS = chromium_args.SCREENSHOT_ARGS
+
+# Unix socket a --daemon instance listens on; set RMN_PW_CAROUSEL_SOCKET to override
+DAEMON_SOCKET = os.environ.get("RMN_PW_CAROUSEL_SOCKET") or daemon_socket.default_path("carousel")
+
+# Requests that never affect how a carousel renders. Images and fonts are
+# kept because they are part of the captured carousel itself.
+BLOCKED_RESOURCE_TYPES = {"media"}
+BLOCKED_URL_PARTS = ("googletagmanager", "google-analytics", "doubleclick", "segment.io", "segment.com")
+
+# Stylesheet responses shared by every page in this process: url -> (headers, body)
+_CSS_CACHE = {}
+# Headers that no longer apply once the body has been decoded by route.fetch()
+_STALE_CSS_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Freeze animations so carousels are captured in their resting state
+DISABLE_ANIMATIONS_CSS = (
+    "*,*::before,*::after{animation:none!important;transition:none!important;"
+    "scroll-behavior:auto!important;caret-color:transparent!important}"
+)
+
+# Every carousel variant in one selector list, so the DOM is walked once per page
+CAROUSEL_SELECTOR = ", ".join([
+    'div.CuratedCarousel.py-32.bg-accent-more-subtle',
+    'div.CuratedCarousel',
+    'div[class*="Carousel"]',
+    'div[data-testid*="carousel"]',
+])
+
 DIAGNOSTICS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "diagnostics")
 os.makedirs(DIAGNOSTICS_DIR, exist_ok=True)
 
@@ -38,14 +85,19 @@ logging.basicConfig(
 logging.info(f"Diagnostics dir: {DIAGNOSTICS_DIR}")
 logging.info(f"Log file: {log_file}")
 
+# Precompiled patterns for filename handling
+_SANITIZE_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+_SANITIZE_REPEAT_UND = re.compile(r'_+')
+_TIMESTAMP_PATTERN = re.compile(r'_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}')
+
 def sanitize_filename(text):
     """Sanitize text for use in filenames"""
     if not text:
         return "unknown"
     # Replace non-alphanumeric characters with underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9]', '_', text.lower())
+    sanitized = _SANITIZE_NON_ALNUM.sub('_', text.lower())
     # Replace multiple underscores with a single one
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _SANITIZE_REPEAT_UND.sub('_', sanitized)
     # Limit length
     return sanitized[:50]
 
@@ -63,12 +115,80 @@ def load_results(results_path):
     """Load results from the JSON file"""
     if os.path.exists(results_path):
         try:
-            with open(results_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            raw = Path(results_path).read_bytes()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
         except (json.JSONDecodeError, IOError) as e:
             logging.error(f"Error loading results: {e}")
     return None
 
+class ScreenshotWriter:
+    """Write screenshot bytes to disk on a background thread"""
+    
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+        self.pending = []
+    
+    def _write(self, path, data):
+        with open(path, "wb") as f:
+            f.write(data)
+    
+    def submit(self, path, data):
+        """Queue a PNG for writing and return immediately"""
+        self.pending.append((path, self.executor.submit(self._write, path, data)))
+    
+    def close(self):
+        """Wait for all queued writes to finish"""
+        for path, future in self.pending:
+            try:
+                future.result()
+            except OSError as e:
+                logging.error(f"Failed to write screenshot {path}: {e}")
+        self.pending.clear()
+        self.executor.shutdown(wait=True)
+
+def is_stylesheet_request(request):
+    """Check whether a request is for a CSS file (including fetch() calls)"""
+    return request.resource_type == "stylesheet" or urlparse(request.url).path.endswith(".css")
+
+def fulfill_stylesheet(route):
+    """Serve a stylesheet from the process-wide cache, fetching it on first use"""
+    url = route.request.url
+    cached = _CSS_CACHE.get(url)
+    if cached is None:
+        try:
+            response = route.fetch()
+        except Exception:
+            route.continue_()
+            return
+        if not response.ok:
+            route.fulfill(response=response)
+            return
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _STALE_CSS_HEADERS}
+        cached = (headers, response.body())
+        _CSS_CACHE[url] = cached
+    
+    headers, body = cached
+    route.fulfill(status=200, headers=headers, body=body)
+
+def block_unneeded_requests(route):
+    """Abort media and analytics requests so the page reaches network idle sooner"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        route.abort()
+    elif is_stylesheet_request(request):
+        fulfill_stylesheet(route)
+    else:
+        route.continue_()
+
+def new_carousel_context(browser):
+    """Create a browser context configured for carousel screenshots"""
+    context = browser.new_context(viewport={"width": 1280, "height": 900}, device_scale_factor=2)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    context.set_default_timeout(ACTION_TIMEOUT_MS)
+    context.route("**/*", block_unneeded_requests)
+    return context
+
 def screenshot_carousel(html_file, output_dir=None, search_term=None):
     """
     Take screenshots of carousel elements in the HTML file
@@ -78,6 +198,43 @@ def screenshot_carousel(html_file, output_dir=None, search_term=None):
         output_dir (str, optional): Directory to save screenshots
         search_term (str, optional): Search term to include in filenames
     """
+    writer = ScreenshotWriter()
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            context = new_carousel_context(browser)
+            try:
+                screenshot_carousel_in_context(context, html_file, output_dir, search_term, writer)
+            finally:
+                context.close()
+        finally:
+            browser.close()
+            writer.close()
+
+def screenshot_carousel_in_context(context, html_file, output_dir=None, search_term=None, writer=None):
+    """
+    Take screenshots of carousel elements in the HTML file using an existing context
+    
+    Args:
+        context (BrowserContext): Playwright context to open the page in
+        html_file (str): Path to the HTML file
+        output_dir (str, optional): Directory to save screenshots
+        search_term (str, optional): Search term to include in filenames
+        writer (ScreenshotWriter, optional): Background writer; files are written inline if omitted
+    
+    Returns:
+        list: Paths of the screenshots that were saved (or queued on the writer)
+    """
+    saved = []
+    
+    def save(path, data):
+        saved.append(path)
+        if writer:
+            writer.submit(path, data)
+        else:
+            with open(path, "wb") as f:
+                f.write(data)
+    
     if not output_dir:
         output_dir = os.path.dirname(html_file)
     
@@ -95,67 +252,73 @@ def screenshot_carousel(html_file, output_dir=None, search_term=None):
         if filename.startswith("search_results_"):
             # Extract search term from filename
             # Format is typically search_results_SEARCH_TERM_TIMESTAMP.html
-            timestamp_pattern = r'_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}'
-            match = re.search(timestamp_pattern, filename)
+            match = _TIMESTAMP_PATTERN.search(filename)
             
             if match:
                 # Get everything between 'search_results_' and the timestamp
                 keyword_part = filename[len('search_results_'):match.start()]
                 search_term = keyword_part.replace('_', ' ').strip()
     
-    # Launch Playwright
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(viewport={"width": 1280, "height": 900}, device_scale_factor=2)
-        page = context.new_page()
+    # Filename parts shared by every carousel on this page
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    search_term_part = f"_{sanitize_filename(search_term)}" if search_term else ""
+    
+    page = context.new_page()
+    
+    try:
+        # Navigate to the HTML file
+        print(f"🌐 Opening HTML file: {file_url}")
+        page.goto(file_url, wait_until="domcontentloaded")
+        page.add_style_tag(content=DISABLE_ANIMATIONS_CSS)
         
+        # Wait for the page to be fully loaded; pages with long-polling
+        # analytics may never go idle, so carry on after the timeout
         try:
-            # Navigate to the HTML file
-            print(f"🌐 Opening HTML file: {file_url}")
-            page.goto(file_url, wait_until="domcontentloaded", timeout=30000)
-            
-            # Wait for the page to be fully loaded
-            page.wait_for_load_state("networkidle", timeout=30000)
-            
-            # Add styling fixes to make the saved HTML render properly
-            print("📝 Adding styling fixes to HTML...")
+            page.wait_for_load_state("networkidle")
+        except PlaywrightTimeoutError:
+            print("   Note: network did not go idle, continuing")
+        
+        # Add styling fixes to make the saved HTML render properly
+        print("📝 Adding styling fixes to HTML...")
+        
+        # 1. Disable Content Security Policy to allow loading external resources
+        page.add_script_tag(content="""
+            // Remove existing CSP meta tags
+            document.querySelectorAll('meta[http-equiv="Content-Security-Policy"]').forEach(tag => tag.remove());
             
-            # 1. Disable Content Security Policy to allow loading external resources
-            page.add_script_tag(content="""
-                // Remove existing CSP meta tags
-                document.querySelectorAll('meta[http-equiv="Content-Security-Policy"]').forEach(tag => tag.remove());
+            // Add a meta tag that allows everything
+            const meta = document.createElement('meta');
+            meta.setAttribute('http-equiv', 'Content-Security-Policy');
+            meta.setAttribute('content', "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:");
+            document.head.appendChild(meta);
+        """)
+        
+        # 2. Add base href to resolve relative URLs
+        page.add_script_tag(content="""
+            // Add base href if it doesn't exist
+            if (!document.querySelector('base')) {
+                const base = document.createElement('base');
+                base.href = 'https://www.kroger.com/';
+                document.head.prepend(base);
+            }
+        """)
+        
+        # 3. Fetch and inline all stylesheets; evaluate() resolves once every
+        #    stylesheet has been inlined or has finished loading on its own
+        print("⏳ Waiting for styles to be applied...")
+        page.evaluate("""
+            async (linkTimeoutMs) => {
+                const linkTags = [...document.querySelectorAll('link[rel="stylesheet"]')];
                 
-                // Add a meta tag that allows everything
-                const meta = document.createElement('meta');
-                meta.setAttribute('http-equiv', 'Content-Security-Policy');
-                meta.setAttribute('content', "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:");
-                document.head.appendChild(meta);
-            """)
-            
-            # 2. Add base href to resolve relative URLs
-            page.add_script_tag(content="""
-                // Add base href if it doesn't exist
-                if (!document.querySelector('base')) {
-                    const base = document.createElement('base');
-                    base.href = 'https://www.kroger.com/';
-                    document.head.prepend(base);
-                }
-            """)
-            
-            # 3. Fetch and inline all stylesheets
-            page.add_script_tag(content="""
-                async function fetchAndInlineStyles() {
-                    const linkTags = Array.from(document.querySelectorAll('link[rel="stylesheet"]'));
-                    
-                    for (const linkTag of linkTags) {
-                        try {
-                            const href = linkTag.href;
-                            if (!href) continue;
-                            
-                            console.log('Fetching stylesheet:', href);
-                            const response = await fetch(href);
-                            if (!response.ok) continue;
-                            
+                // Fetch every stylesheet concurrently
+                await Promise.all(linkTags.map(async linkTag => {
+                    try {
+                        const href = linkTag.href;
+                        if (!href) return;
+                        
+                        console.log('Fetching stylesheet:', href);
+                        const response = await fetch(href);
+                        if (response.ok) {
                             const cssText = await response.text();
                             
                             // Create a style element with the fetched CSS
@@ -163,118 +326,127 @@ def screenshot_carousel(html_file, output_dir=None, search_term=None):
                             style.textContent = cssText;
                             
                             // Replace the link tag with the style tag
-                            linkTag.parentNode.insertBefore(style, linkTag);
-                            linkTag.remove();
+                            linkTag.replaceWith(style);
                             
                             console.log('Inlined stylesheet:', href);
-                        } catch (error) {
-                            console.error('Error inlining stylesheet:', error);
+                            return;
                         }
+                    } catch (error) {
+                        console.error('Error inlining stylesheet:', error);
+                    }
+                    
+                    // Not inlined: wait for the original link to load or fail.
+                    // A link that already failed never fires again, hence the timer.
+                    if (!linkTag.sheet) {
+                        await new Promise(resolve => {
+                            linkTag.addEventListener('load', resolve, { once: true });
+                            linkTag.addEventListener('error', resolve, { once: true });
+                            setTimeout(resolve, linkTimeoutMs);
+                        });
                     }
-                }
+                }));
+                return true;
+            }
+        """, ACTION_TIMEOUT_MS)
+        page.evaluate("() => document.fonts.ready.then(() => true)")
+        
+        # Find carousel elements (document order, each element once)
+        carousels = page.locator(CAROUSEL_SELECTOR).all()
+        carousel_count = 0
+        
+        if carousels:
+            print(f"🎠 Found {len(carousels)} carousel(s)")
+        
+        for i, carousel in enumerate(carousels):
+            try:
+                # Wait for the carousel to be visible
+                carousel.wait_for(state="visible", timeout=5000)
                 
-                fetchAndInlineStyles();
-            """)
-            
-            # Wait for styles to be applied
-            print("⏳ Waiting for styles to be applied...")
-            page.wait_for_timeout(2000)  # Give time for styles to be fetched and applied
-            
-            # Find carousel elements
-            selectors = [
-                'div.CuratedCarousel.py-32.bg-accent-more-subtle',
-                'div.CuratedCarousel',
-                'div[class*="Carousel"]',
-                'div[data-testid*="carousel"]'
-            ]
-            
-            carousel_count = 0
-            
-            for selector in selectors:
-                carousels = page.locator(selector).all()
+                # Scroll the carousel into view
+                carousel.scroll_into_view_if_needed()
                 
-                if not carousels:
-                    continue
+                # Wait for images inside to finish loading; long-polling pages
+                # never go idle, so capture what has rendered after the timeout
+                try:
+                    page.wait_for_load_state("networkidle", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
                 
-                print(f"🎠 Found {len(carousels)} carousel(s) with selector: {selector}")
+                # Get carousel header text if available
+                header_text = "unknown"
+                try:
+                    header = carousel.locator('.CuratedCarousel__header, h2, .header').first
+                    if header:
+                        header_text = header.text_content().strip()
+                except Exception as e:
+                    print(f"   Note: Could not extract header text: {e}")
                 
-                for i, carousel in enumerate(carousels):
-                    try:
-                        # Wait for the carousel to be visible
-                        carousel.wait_for(state="visible", timeout=5000)
-                        
-                        # Scroll the carousel into view
-                        carousel.scroll_into_view_if_needed()
-                        
-                        # Wait for images inside to finish loading
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                        page.wait_for_timeout(500)  # Additional wait for any animations
-                        
-                        # Get carousel header text if available
-                        header_text = "unknown"
-                        try:
-                            header = carousel.locator('.CuratedCarousel__header, h2, .header').first
-                            if header:
-                                header_text = header.text_content().strip()
-                        except Exception as e:
-                            print(f"   Note: Could not extract header text: {e}")
-                        
-                        # Generate filename
-                        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                        safe_header = sanitize_filename(header_text)
-                        
-                        # Include search term in filename if available
-                        search_term_part = ""
-                        if search_term:
-                            safe_search_term = sanitize_filename(search_term)
-                            search_term_part = f"_{safe_search_term}"
-                        
-                        filename = f"carousel_{safe_header}{search_term_part}_{timestamp}.png"
-                        filepath = os.path.join(carousel_dir, filename)
-                        
-                        # Take screenshot with padding
-                        try:
-                            # Get bounding box
-                            box = carousel.bounding_box()
-                            pad = 16  # Add padding around the element
-                            
-                            # Create clip area with padding
-                            clip = {
-                                "x": max(0, box["x"] - pad),
-                                "y": max(0, box["y"] - pad),
-                                "width": min(page.viewport_size()["width"] - box["x"] + pad, box["width"] + 2 * pad),
-                                "height": box["height"] + 2 * pad
-                            }
-                            
-                            # Take screenshot with clip area
-                            page.screenshot(path=filepath, clip=clip)
-                            print(f"📸 Carousel screenshot saved to: {filepath}")
-                            carousel_count += 1
-                            
-                        except Exception as e:
-                            print(f"❌ Error taking screenshot with padding: {e}")
-                            
-                            # Fallback: take direct element screenshot
-                            try:
-                                carousel.screenshot(path=filepath)
-                                print(f"📸 Carousel screenshot saved to: {filepath} (direct method)")
-                                carousel_count += 1
-                            except Exception as e2:
-                                print(f"❌ Error taking direct screenshot: {e2}")
+                # Generate filename; the index keeps carousels with the same header apart
+                safe_header = sanitize_filename(header_text)
+                filename = f"carousel_{safe_header}{search_term_part}_{timestamp}_{i+1}.png"
+                filepath = os.path.join(carousel_dir, filename)
+                
+                # Take screenshot with padding
+                try:
+                    # Get bounding box
+                    box = carousel.bounding_box()
+                    pad = 16  # Add padding around the element
                     
-                    except Exception as e:
-                        print(f"❌ Error processing carousel {i+1}: {e}")
+                    # Create clip area with padding
+                    clip = {
+                        "x": max(0, box["x"] - pad),
+                        "y": max(0, box["y"] - pad),
+                        "width": min(page.viewport_size()["width"] - box["x"] + pad, box["width"] + 2 * pad),
+                        "height": box["height"] + 2 * pad
+                    }
+                    
+                    # Take screenshot with clip area
+                    save(filepath, page.screenshot(clip=clip))
+                    print(f"📸 Carousel screenshot saved to: {filepath}")
+                    carousel_count += 1
+                    
+                except Exception as e:
+                    print(f"❌ Error taking screenshot with padding: {e}")
+                    
+                    # Fallback: take direct element screenshot
+                    try:
+                        save(filepath, carousel.screenshot())
+                        print(f"📸 Carousel screenshot saved to: {filepath} (direct method)")
+                        carousel_count += 1
+                    except Exception as e2:
+                        print(f"❌ Error taking direct screenshot: {e2}")
             
-            if carousel_count == 0:
-                print("⚠️ No carousels found or captured")
-            else:
-                print(f"✅ Successfully captured {carousel_count} carousel(s)")
-                
-        except Exception as e:
-            print(f"❌ Error processing HTML file: {e}")
+            except Exception as e:
+                print(f"❌ Error processing carousel {i+1}: {e}")
         
+        if carousel_count == 0:
+            print("⚠️ No carousels found or captured")
+        else:
+            print(f"✅ Successfully captured {carousel_count} carousel(s)")
+            
+    except Exception as e:
+        print(f"❌ Error processing HTML file: {e}")
+    
+    finally:
+        page.close()
+    
+    return saved
+
+def process_batch(jobs, output_dir=None):
+    """Screenshot carousels for several HTML files with a single browser"""
+    writer = ScreenshotWriter()
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            for html_file, search_term in jobs:
+                context = new_carousel_context(browser)
+                try:
+                    screenshot_carousel_in_context(context, html_file, output_dir, search_term, writer)
+                finally:
+                    context.close()
         finally:
             browser.close()
+            writer.close()
 
 def process_results_file(results_path, output_dir=None):
     """Process carousel data from the results file"""
@@ -283,16 +455,83 @@ def process_results_file(results_path, output_dir=None):
         print("❌ No results found")
         return False
     
-    # Process each result
+    # Collect the HTML files to process
+    jobs = []
     for result in results.get("results", []):
         html_file = result.get("source_file")
         search_term = result.get("keyword")
         
         if html_file and os.path.exists(html_file):
-            screenshot_carousel(html_file, output_dir, search_term)
+            jobs.append((html_file, search_term))
+    
+    if not jobs:
+        return True
+    
+    # Split the files across workers; each worker launches one browser and
+    # reuses it for all of its files (Playwright's sync API is per-thread)
+    workers = min(DEFAULT_WORKERS, len(jobs))
+    batches = [jobs[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_batch, batch, output_dir) for batch in batches]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Carousel worker failed: {e}")
     
     return True
 
+def serve_unix_socket(socket_path=DAEMON_SOCKET):
+    """
+    Keep one browser running and screenshot HTML files sent over a Unix socket
+    
+    Each connection carries one JSON line such as
+    {"html_file": ..., "search_term": ..., "output_dir": ...} and gets back
+    {"ok": true, "paths": [...]} once the screenshots are on disk.
+    """
+    daemon_socket.prepare(socket_path)
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(socket_path)
+            daemon_socket.restrict(socket_path)
+            server.listen()
+            print(f"🟢 Listening for carousel tasks on {socket_path}")
+            
+            while True:
+                conn, _ = server.accept()
+                with conn, conn.makefile("rwb") as stream:
+                    try:
+                        task = daemon_socket.decode(stream.readline())
+                        if task is None:
+                            # A liveness probe connects and hangs up without a task
+                            continue
+                        context = new_carousel_context(browser)
+                        try:
+                            # Written inline so the files exist when the reply is sent
+                            paths = screenshot_carousel_in_context(
+                                context, task["html_file"], task.get("output_dir"), task.get("search_term")
+                            )
+                        finally:
+                            context.close()
+                        reply = {"ok": True, "paths": paths}
+                    except Exception as e:
+                        logging.error(f"Daemon task failed: {e}")
+                        reply = {"ok": False, "error": str(e)}
+                    
+                    try:
+                        stream.write(daemon_socket.encode(reply))
+                        stream.flush()
+                    except OSError as e:
+                        logging.error(f"Could not reply to daemon client: {e}")
+        finally:
+            server.close()
+            browser.close()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description="Screenshot carousel elements from HTML files")
@@ -300,14 +539,44 @@ def main():
     parser.add_argument("--results", "-r", type=str, help="Results JSON file to process")
     parser.add_argument("--output-dir", "-o", type=str, help="Output directory for screenshots")
     parser.add_argument("--search-term", "-s", type=str, help="Search term to include in filenames")
+    parser.add_argument("--daemon", action="store_true", help=f"Keep a browser running and serve tasks on {DAEMON_SOCKET}")
+    parser.add_argument("--daemon-timeout", type=float, default=daemon_socket.CLIENT_TIMEOUT, help=f"Seconds to wait for a running daemon's reply (default: {daemon_socket.CLIENT_TIMEOUT})")
     args = parser.parse_args()
     
+    if args.daemon:
+        try:
+            serve_unix_socket(DAEMON_SOCKET)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return False
+        except KeyboardInterrupt:
+            pass
+        return True
+    
     # Process a single HTML file
     if args.input:
         if not os.path.exists(args.input):
             print(f"❌ HTML file not found: {args.input}")
             return False
         
+        # Reuse a warm browser if a daemon is running
+        try:
+            reply = daemon_socket.request({
+                "html_file": os.path.abspath(args.input),
+                "search_term": args.search_term,
+                "output_dir": os.path.abspath(args.output_dir) if args.output_dir else None,
+            }, DAEMON_SOCKET, args.daemon_timeout)
+        except TimeoutError as e:
+            # The daemon still owns the task; capturing here would race it for the same files
+            print(f"❌ {e}")
+            return False
+        if reply is not None and reply.get("ok"):
+            for path in reply["paths"]:
+                print(f"📸 Carousel screenshot saved to: {path}")
+            return True
+        if reply is not None:
+            print(f"⚠️ Daemon failed ({reply.get('error')}), processing locally")
+        
         screenshot_carousel(args.input, args.output_dir, args.search_term)
         return True
     
@@ -11,9 +11,109 @@ import os
 import sys
 import json
 import argparse
-import time
+import asyncio
+import base64
+import io
+import shutil
+from dataclasses import dataclass, field
 from datetime import datetime
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from pathlib import Path
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, CDPSession, TimeoutError as PlaywrightTimeoutError
+import chromium_args
+import daemon_socket
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Number of reusable pages loading images at the same time
+DEFAULT_CONCURRENCY = 8
+
+# Direct image downloads in flight at once (no browser involved)
+DOWNLOAD_CONCURRENCY = 16
+DOWNLOAD_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+
+# Playwright timeouts (ms); set RMN_PW_TIMEOUT_MS to allow slower navigation
+NAVIGATION_TIMEOUT_MS = int(os.environ.get("RMN_PW_TIMEOUT_MS", "10000"))
+ACTION_TIMEOUT_MS = 5000
+# Tighter cap for loading a single image, raised by RMN_PW_TIMEOUT_MS as well
+IMAGE_TIMEOUT_MS = int(os.environ.get("RMN_PW_TIMEOUT_MS", "8000"))
+
+# Chromium flags for the image browser, shared with the carousel script
+CHROMIUM_ARGS = chromium_args.SCREENSHOT_ARGS
+
+# Unix socket a --daemon instance listens on; set RMN_PW_TOA_SOCKET to override
+DAEMON_SOCKET = os.environ.get("RMN_PW_TOA_SOCKET") or daemon_socket.default_path("toa")
+
+# Viewport for the image pages. Chromium shrinks an image opened directly to
+# fit the window, so a smaller one would lower the resolution of the capture.
+DEFAULT_VIEWPORT = {"width": 1280, "height": 720}
+
+# True once the page's image has finished decoding
+IMAGE_READY_JS = "() => { const i = document.images[0]; return i && i.complete && i.naturalWidth > 0; }"
+
+# Document-relative clip rectangle of the page's image, as Page.captureScreenshot expects
+IMAGE_CLIP_JS = """() => {
+    const i = document.images[0];
+    if (!i) return null;
+    const r = i.getBoundingClientRect();
+    if (!r.width || !r.height) return null;
+    return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height, scale: 1};
+}"""
+
+@dataclass(slots=True)
+class AdImage:
+    """An ad image to screenshot, with the metadata used to name the output file"""
+    url: str
+    keyword: str
+    search_term: str
+    clean_search_term: str
+    alt_text: str
+    source_file: str
+    ad_type: str
+    # Kept for backward compatibility with the old dict format
+    id: str | None
+    # Other search terms that showed the same creative; their files are linked to this capture
+    other_search_terms: list[str] = field(default_factory=list)
+
+def iter_results(json_file):
+    """
+    Yield each entry of a results file's "results" list, streaming it with ijson when available
+    """
+    if HAS_IJSON:
+        with open(json_file, "rb") as f:
+            yield from ijson.items(f, "results.item")
+        return
+    
+    raw = Path(json_file).read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    yield from data.get("results", [])
 
 def extract_image_urls_from_json(json_file, html_file=None, time_window_minutes=10):
     """
@@ -26,16 +126,11 @@ def extract_image_urls_from_json(json_file, html_file=None, time_window_minutes=
         time_window_minutes (int): Only process results within this many minutes (default: 10)
         
     Returns:
-        list: List of image URLs with metadata
+        list[AdImage]: Ad images grouped by ad type
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        image_urls = []
-        
-        # Track seen URLs to avoid duplicates within the same search term
-        seen_urls_by_search_term = {}
+        # One entry per unique image URL; repeats under other search terms are attached to it
+        by_url = {}
         
         # Calculate cutoff time (current time minus time_window_minutes)
         from datetime import datetime, timedelta
@@ -44,105 +139,116 @@ def extract_image_urls_from_json(json_file, html_file=None, time_window_minutes=
         
         print(f"🕒 Only processing results newer than {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')} (within {time_window_minutes} minutes)")
         
+        # Normalize the HTML file filter once rather than per result
+        html_file_norm = os.path.normpath(html_file) if html_file else None
+        html_file_base = os.path.basename(html_file_norm) if html_file_norm else None
+        
         # Extract image URLs from the JSON structure
-        if "results" in data:
-            for result in data["results"]:
-                # Skip time window check when html_file is specified - we only want results from that specific file
-                if not html_file:
-                    # Only apply time window filtering when processing entire JSON without specific HTML file
-                    result_timestamp_str = result.get("timestamp", "")
-                    if result_timestamp_str:
-                        try:
-                            result_timestamp = datetime.strptime(result_timestamp_str, "%Y-%m-%d %H:%M:%S")
-                            if result_timestamp < cutoff_time:
-                                print(f"⏭️ Skipping old result from {result_timestamp_str} (outside {time_window_minutes}-minute window)")
-                                continue
-                            else:
-                                print(f"✅ Processing recent result from {result_timestamp_str}")
-                        except ValueError:
-                            print(f"⚠️ Could not parse timestamp '{result_timestamp_str}', processing anyway")
-                
-                # If html_file is specified, only process results from that HTML file
-                # Otherwise, process all results regardless of source file
-                if html_file:
-                    # Normalize paths for comparison
-                    source_file = os.path.normpath(result.get("source_file", ""))
-                    html_file_norm = os.path.normpath(html_file)
-                    
-                    # Compare basenames if full paths don't match
-                    if source_file != html_file_norm and os.path.basename(source_file) != os.path.basename(html_file_norm):
-                        print(f"Skipping result from {source_file} (looking for {html_file_norm})")
-                        continue
-                    
-                # Get search_term from result or keyword as fallback
-                search_term = result.get("search_term", result.get("keyword", "unknown"))
+        for result in iter_results(json_file):
+            # Skip time window check when html_file is specified - we only want results from that specific file
+            if not html_file:
+                # Only apply time window filtering when processing entire JSON without specific HTML file
+                result_timestamp_str = result.get("timestamp", "")
+                if result_timestamp_str:
+                    try:
+                        result_timestamp = datetime.strptime(result_timestamp_str, "%Y-%m-%d %H:%M:%S")
+                        if result_timestamp < cutoff_time:
+                            print(f"⏭️ Skipping old result from {result_timestamp_str} (outside {time_window_minutes}-minute window)")
+                            continue
+                        else:
+                            print(f"✅ Processing recent result from {result_timestamp_str}")
+                    except ValueError:
+                        print(f"⚠️ Could not parse timestamp '{result_timestamp_str}', processing anyway")
+            
+            # If html_file is specified, only process results from that HTML file
+            # Otherwise, process all results regardless of source file
+            if html_file:
+                # Normalize paths for comparison
+                source_file = os.path.normpath(result.get("source_file", ""))
                 
-                # Initialize seen URLs set for this search term if not already present
-                if search_term not in seen_urls_by_search_term:
-                    seen_urls_by_search_term[search_term] = set()
+                # Compare basenames if full paths don't match
+                if source_file != html_file_norm and os.path.basename(source_file) != html_file_base:
+                    print(f"Skipping result from {source_file} (looking for {html_file_norm})")
+                    continue
                 
-                if "ads" in result:
-                    for ad in result["ads"]:
-                        if "image_url" in ad:
-                            image_url = ad["image_url"]
-                            # Add domain if it's a relative URL
-                            if image_url.startswith('/'):
-                                image_url = f"https://www.kroger.com{image_url}"
-                            
-                            # Skip duplicates within the same search term
-                            if image_url in seen_urls_by_search_term[search_term]:
+            # Get search_term from result or keyword as fallback
+            search_term = result.get("search_term", result.get("keyword", "unknown"))
+            
+            if "ads" in result:
+                for ad in result["ads"]:
+                    if "image_url" in ad:
+                        image_url = ad["image_url"]
+                        # Add domain if it's a relative URL
+                        if image_url.startswith('/'):
+                            image_url = f"https://www.kroger.com{image_url}"
+                        
+                        # Clean search term for filename use
+                        clean_search_term = search_term.replace(" ", "_").lower()
+                        
+                        # Capture each creative once, however many search terms showed it
+                        existing = by_url.get(image_url)
+                        if existing:
+                            if clean_search_term != existing.clean_search_term and clean_search_term not in existing.other_search_terms:
+                                existing.other_search_terms.append(clean_search_term)
+                            else:
                                 print(f"Skipping duplicate image URL: {image_url}")
-                                continue
-                            
-                            # Add to seen URLs for this search term
-                            seen_urls_by_search_term[search_term].add(image_url)
-                            
-                            # Clean search term for filename use
-                            clean_search_term = search_term.replace(" ", "_").lower()
-                            
-                            # Get ad type (default to TOA if not specified)
-                            ad_type = ad.get("type", "TOA")
-                            
-                            image_urls.append({
-                                "url": image_url,
-                                "keyword": result.get("keyword", "unknown"),
-                                "search_term": search_term,
-                                "clean_search_term": clean_search_term,
-                                "alt_text": ad.get("message", ""),
-                                "source_file": result.get("source_file", ""),
-                                "ad_type": ad_type,
-                                # Keep the old ID for backward compatibility
-                                "id": image_url.split('/')[-1].split('.')[0] if '/' in image_url else None
-                            })
+                            continue
+                        
+                        # Get ad type (default to TOA if not specified)
+                        ad_type = ad.get("type", "TOA")
+                        
+                        by_url[image_url] = AdImage(
+                            url=image_url,
+                            keyword=result.get("keyword", "unknown"),
+                            search_term=search_term,
+                            clean_search_term=clean_search_term,
+                            alt_text=ad.get("message", ""),
+                            source_file=result.get("source_file", ""),
+                            ad_type=ad_type,
+                            id=image_url.split('/')[-1].split('.')[0] if '/' in image_url else None
+                        )
         
+        # Group images of the same ad type together (sort is stable)
+        image_urls = sorted(by_url.values(), key=lambda image: image.ad_type)
         return image_urls
     
     except Exception as e:
         print(f"❌ Error extracting image URLs from JSON: {e}")
         return []
 
-def screenshot_image(page: Page, output_path: str):
+def link_screenshots(src, dsts):
+    """Hardlink a saved screenshot under other names, copying where links are unsupported"""
+    for dst in dsts:
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(src, dst)
+        print(f"✅ Image screenshot linked to: {dst}")
+
+async def write_file(path, data):
+    """Write bytes to disk without blocking the event loop"""
+    if HAS_AIOFILES:
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+    else:
+        await asyncio.to_thread(Path(path).write_bytes, data)
+
+async def screenshot_image(page: Page, cdp: CDPSession, output_path: str):
     """
     Take a precise screenshot of just the image element
     """
     try:
-        # Wait for the image to be visible
-        page.wait_for_selector("img", state="visible", timeout=10000)
-        
-        # Get image element
-        img_element = page.query_selector("img")
-        if not img_element:
+        # Capture straight through the page's CDP session: one call for the
+        # clip rectangle, one for the pixels
+        clip = await page.evaluate(IMAGE_CLIP_JS)
+        if not clip:
             print("❌ Image element not found")
             return False
         
-        # Get image dimensions and position
-        bbox = img_element.bounding_box()
-        if not bbox:
-            print("❌ Could not get image bounding box")
-            return False
-        
-        # Take screenshot of just the image element
-        img_element.screenshot(path=output_path)
+        result = await cdp.send("Page.captureScreenshot", {"format": "png", "clip": clip})
+        await write_file(output_path, base64.b64decode(result["data"]))
         
         print(f"✅ Image screenshot saved to: {output_path}")
         return True
@@ -151,14 +257,10 @@ def screenshot_image(page: Page, output_path: str):
         print(f"❌ Error taking screenshot: {e}")
         return False
 
-def process_images(image_urls, output_dir, client=None, headless=False):
+def make_target_dirs(output_dir, client=None):
     """
-    Process image URLs and take screenshots
+    Create the per-ad-type output directories and return them keyed by ad type
     """
-    if not image_urls:
-        print("❌ No image URLs found")
-        return
-    
     # Set up base output directory
     if client:
         base_dir = os.path.join(output_dir, client)
@@ -166,96 +268,355 @@ def process_images(image_urls, output_dir, client=None, headless=False):
         base_dir = output_dir
     
     # Create directories for each ad type
-    toa_dir = os.path.join(base_dir, "TOA")
-    skyscraper_dir = os.path.join(base_dir, "Skyscraper")
-    carousel_dir = os.path.join(base_dir, "Carousel")
+    target_dirs = {
+        "toa": os.path.join(base_dir, "TOA"),
+        "skyscraper": os.path.join(base_dir, "Skyscraper"),
+        "carousel": os.path.join(base_dir, "Carousel"),
+    }
     
     # Ensure all directories exist
-    os.makedirs(toa_dir, exist_ok=True)
-    os.makedirs(skyscraper_dir, exist_ok=True)
-    os.makedirs(carousel_dir, exist_ok=True)
+    for target_dir in target_dirs.values():
+        os.makedirs(target_dir, exist_ok=True)
+    
+    return target_dirs
+
+def run_timestamp():
+    """Timestamp shared by every file saved in one run; the per-image index keeps names unique"""
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+def output_paths_for(i, image_info: AdImage, target_dirs, run_ts):
+    """
+    Build the output path for an image, followed by one path per other search term that showed it
+    """
+    # Get ad type (default to 'toa' if not specified)
+    ad_type = image_info.ad_type.lower()
+    
+    # Determine the appropriate directory based on ad type
+    if "skyscraper" in ad_type:
+        target_dir = target_dirs["skyscraper"]
+    elif "carousel" in ad_type:
+        target_dir = target_dirs["carousel"]
+    else:  # Default to TOA
+        target_dir = target_dirs["toa"]
+    
+    # Use the same format as main screenshots: type_search-term_date_time_index
+    return [
+        os.path.join(target_dir, f"{ad_type}_{search_term}_{run_ts}_{i+1}.png")
+        for search_term in (image_info.clean_search_term, *image_info.other_search_terms)
+    ]
+
+def save_png(data, output_path):
+    """Re-encode downloaded image bytes as a PNG, matching what a screenshot would produce"""
+    # Write beside the target and swap it in, so a failed re-encode never
+    # leaves a truncated PNG where the browser fallback would not replace it
+    tmp_path = Path(output_path).with_suffix(".tmp")
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.save(tmp_path, "PNG")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+async def download_image(client, i, total, image_info: AdImage, target_dirs, run_ts):
+    """
+    Fetch one image URL over plain HTTP and save it without a browser
+    
+    Returns:
+        str: Path of the saved image, or None if the URL has to go through the browser
+    """
+    try:
+        response = await client.get(image_info.url)
+    except httpx.HTTPError as e:
+        print(f"⚠️ Direct download failed for {image_info.url}: {e}")
+        return None
+    
+    # Anything that isn't an image (e.g. a bot-check page) is left to the browser
+    if response.status_code != 200 or not response.headers.get("content-type", "").startswith("image/"):
+        return None
+    
+    output_path, *link_paths = output_paths_for(i, image_info, target_dirs, run_ts)
+    try:
+        await asyncio.to_thread(save_png, response.content, output_path)
+    except Exception as e:
+        # e.g. PIL.UnidentifiedImageError for formats Pillow can't decode
+        print(f"⚠️ Could not save downloaded image {image_info.url}: {e}")
+        return None
+    
+    if link_paths:
+        await asyncio.to_thread(link_screenshots, output_path, link_paths)
+    print(f"✅ Image {i+1}/{total} downloaded to: {output_path}")
+    return output_path
+
+async def download_images(image_urls, target_dirs, run_ts, max_connections=DOWNLOAD_CONCURRENCY):
+    """
+    Save every image that can be fetched directly, skipping Chromium entirely
+    
+    Returns:
+        tuple: (saved paths, list of (index, AdImage) pairs that still need the browser)
+    """
+    indexed_images = list(enumerate(image_urls))
+    if not (HAS_HTTPX and HAS_PIL):
+        return [], indexed_images
+    
+    total = len(image_urls)
+    semaphore = asyncio.Semaphore(max_connections)
+    
+    async def bounded_download(client, i, image_info):
+        async with semaphore:
+            return await download_image(client, i, total, image_info, target_dirs, run_ts)
+    
+    async with httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=NAVIGATION_TIMEOUT_MS / 1000,
+        headers={"User-Agent": DOWNLOAD_USER_AGENT},
+    ) as client:
+        results = await asyncio.gather(*[
+            bounded_download(client, i, image_info) for i, image_info in indexed_images
+        ])
+    
+    saved = [path for path in results if path]
+    remaining = [pair for pair, path in zip(indexed_images, results) if not path]
+    print(f"⬇️ Downloaded {len(saved)}/{total} image(s) directly; {len(remaining)} need the browser")
+    return saved, remaining
+
+async def capture_image(page: Page, cdp: CDPSession, i, total, image_info: AdImage, target_dirs, run_ts):
+    """
+    Navigate a pooled page to one image URL and screenshot it
+    
+    Returns:
+        str: Path of the saved screenshot, or None if it failed
+    """
+    image_url = image_info.url
+    keyword = image_info.keyword
+    alt_text = image_info.alt_text
+    
+    print(f"\n📷 Processing image {i+1}/{total}")
+    print(f"🔗 URL: {image_url}")
+    print(f"🔑 Keyword: {keyword}")
+    print(f"📝 Alt text: {alt_text}")
     
-    with sync_playwright() as p:
-        # Launch browser
-        browser = p.chromium.launch(headless=headless)
+    try:
+        # Navigate to the image URL
+        print(f"🌐 Opening image URL")
+        try:
+            await page.goto(image_url, wait_until="commit", timeout=IMAGE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            print(f"⏭️ Skipping image, no response within {IMAGE_TIMEOUT_MS / 1000:g}s: {image_url}")
+            return None
         
-        # Create a browser context
-        context = browser.new_context(
-            viewport={"width": 1280, "height": 720}
-        )
+        # Wait until the image itself is decoded rather than for network idle
+        await page.wait_for_function(IMAGE_READY_JS, timeout=IMAGE_TIMEOUT_MS)
+        
+        # Generate output filenames with ad type, search_term, date, time, and index
+        output_path, *link_paths = output_paths_for(i, image_info, target_dirs, run_ts)
+        
+        # Take screenshot of just the image
+        if await screenshot_image(page, cdp, output_path):
+            # Give every other search term that showed this creative its own file,
+            # off the event loop so other pages keep navigating
+            if link_paths:
+                await asyncio.to_thread(link_screenshots, output_path, link_paths)
+            return output_path
+        
+        print("❌ Failed to screenshot image")
+        return None
+    
+    except Exception as e:
+        print(f"❌ Error processing {image_url}: {e}")
+        return None
+
+async def page_worker(context: BrowserContext, queue: asyncio.Queue, total, target_dirs, run_ts, saved):
+    """
+    Own one page for the whole run and feed it image URLs from the shared queue
+    """
+    page = await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    try:
+        while True:
+            try:
+                i, image_info = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            output_path = await capture_image(page, cdp, i, total, image_info, target_dirs, run_ts)
+            if output_path:
+                saved.append(output_path)
+    finally:
+        await cdp.detach()
+        await page.close()
+
+async def capture_images(browser: Browser, indexed_images, total, target_dirs, run_ts, max_concurrency=DEFAULT_CONCURRENCY):
+    """
+    Screenshot (index, AdImage) pairs in a fresh context on an already running browser
+    
+    Returns:
+        list: Paths of the screenshots that were saved
+    """
+    # Create a browser context shared by all image pages
+    context = await browser.new_context(
+        viewport=DEFAULT_VIEWPORT
+    )
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    context.set_default_timeout(ACTION_TIMEOUT_MS)
+    
+    saved = []
+    try:
+        # Queue every image, then let a small pool of reusable pages drain it
+        queue = asyncio.Queue()
+        for pair in indexed_images:
+            queue.put_nowait(pair)
         
-        # Create a new page
-        page = context.new_page()
+        pool_size = max(1, min(max_concurrency, len(indexed_images)))
+        await asyncio.gather(*[
+            page_worker(context, queue, total, target_dirs, run_ts, saved)
+            for _ in range(pool_size)
+        ])
+    finally:
+        await context.close()
+    
+    return saved
+
+async def process_images_async(image_urls, output_dir, client=None, headless=False, max_concurrency=DEFAULT_CONCURRENCY):
+    """
+    Save image URLs, downloading them directly where possible and screenshotting
+    the rest on several concurrently loading pages
+    """
+    if not image_urls:
+        print("❌ No image URLs found")
+        return []
+    
+    target_dirs = make_target_dirs(output_dir, client)
+    run_ts = run_timestamp()
+    saved, remaining = await download_images(image_urls, target_dirs, run_ts)
+    if not remaining:
+        return saved
+    
+    async with async_playwright() as p:
+        # Launch browser only for the images that could not be downloaded
+        browser = await p.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
         
         try:
-            for i, image_info in enumerate(image_urls):
-                image_url = image_info["url"]
-                keyword = image_info["keyword"]
-                alt_text = image_info["alt_text"]
-                img_id = image_info["id"]
-                
-                print(f"\n📷 Processing image {i+1}/{len(image_urls)}")
-                print(f"🔗 URL: {image_url}")
-                print(f"🔑 Keyword: {keyword}")
-                print(f"📝 Alt text: {alt_text}")
-                
-                # Navigate to the image URL
-                print(f"🌐 Opening image URL")
-                page.goto(image_url)
-                
-                # Wait for the image to load
-                page.wait_for_load_state("networkidle")
-                
-                # Generate output filename with ad type, search_term, date, time, and index
-                clean_search_term = image_info.get("clean_search_term", keyword.replace(" ", "_").lower())
-                
-                # Get current date and time for filename
-                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                
-                # Get ad type (default to 'toa' if not specified)
-                ad_type = image_info.get("ad_type", "toa").lower()
-                
-                # Use the same format as main screenshots: type_search-term_date_time_index
-                filename = f"{ad_type}_{clean_search_term}_{timestamp}_{i+1}.png"
-                
-                # Determine the appropriate directory based on ad type
-                ad_type_lower = ad_type.lower()
-                
-                if "skyscraper" in ad_type_lower:
-                    target_dir = skyscraper_dir
-                elif "carousel" in ad_type_lower:
-                    target_dir = carousel_dir
-                else:  # Default to TOA
-                    target_dir = toa_dir
-                    
-                # Full path to save the image
-                output_path = os.path.join(target_dir, filename)
-                
-                # Take screenshot of just the image
-                success = screenshot_image(page, output_path)
-                
-                if not success:
-                    print("❌ Failed to screenshot image")
-                
-                # Wait a moment before processing the next image
-                time.sleep(2)
-            
+            saved += await capture_images(browser, remaining, len(image_urls), target_dirs, run_ts, max_concurrency)
         except Exception as e:
             print(f"❌ Error: {e}")
         finally:
             # Close browser
-            browser.close()
+            await browser.close()
+    
+    return saved
+
+def process_images(image_urls, output_dir, client=None, headless=False, max_concurrency=DEFAULT_CONCURRENCY):
+    """
+    Process image URLs and take screenshots
+    """
+    return asyncio.run(process_images_async(image_urls, output_dir, client, headless, max_concurrency))
+
+async def handle_daemon_client(browser: Browser, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Run one JSON task received over the daemon socket and reply with the saved paths
+    """
+    try:
+        task = daemon_socket.decode(await reader.readline())
+        if task is None:
+            # A liveness probe connects and hangs up without a task
+            writer.close()
+            return
+        image_urls = extract_image_urls_from_json(
+            task["json_file"], task.get("html_file"), task.get("time_window", 10)
+        )
+        paths = []
+        if image_urls:
+            target_dirs = make_target_dirs(task.get("output", "output"), task.get("client"))
+            run_ts = run_timestamp()
+            paths, remaining = await download_images(image_urls, target_dirs, run_ts)
+            if remaining:
+                paths += await capture_images(
+                    browser, remaining, len(image_urls), target_dirs, run_ts,
+                    task.get("concurrency", DEFAULT_CONCURRENCY)
+                )
+        reply = {"ok": True, "found": len(image_urls), "paths": paths}
+    except Exception as e:
+        print(f"❌ Daemon task failed: {e}")
+        reply = {"ok": False, "error": str(e)}
+    
+    try:
+        writer.write(daemon_socket.encode(reply))
+        await writer.drain()
+    finally:
+        writer.close()
+
+async def serve_unix_socket(socket_path=DAEMON_SOCKET, headless=False):
+    """
+    Keep one browser running and serve screenshot tasks from a Unix socket
+    """
+    daemon_socket.prepare(socket_path)
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+        try:
+            server = await asyncio.start_unix_server(
+                lambda reader, writer: handle_daemon_client(browser, reader, writer),
+                path=socket_path
+            )
+            daemon_socket.restrict(socket_path)
+            print(f"🟢 Listening for screenshot tasks on {socket_path}")
+            async with server:
+                await server.serve_forever()
+        finally:
+            await browser.close()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
 
 def main():
     parser = argparse.ArgumentParser(description="Screenshot TOA images from JSON file")
-    parser.add_argument("--json", "-j", required=True, help="Path to TOA JSON file")
+    parser.add_argument("--json", "-j", help="Path to TOA JSON file")
     parser.add_argument("--html", "-f", help="Path to specific HTML file to process")
     parser.add_argument("--client", "-c", help="Client name for organizing output")
     parser.add_argument("--output", "-o", default="output", help="Output directory (default: output)")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode (no browser UI)")
     parser.add_argument("--time-window", "-t", type=int, default=10, help="Only process results within this many minutes (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help=f"Images to load at the same time (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--daemon", action="store_true", help=f"Keep a browser running and serve tasks on {DAEMON_SOCKET}")
+    parser.add_argument("--daemon-timeout", type=float, default=daemon_socket.CLIENT_TIMEOUT, help=f"Seconds to wait for a running daemon's reply (default: {daemon_socket.CLIENT_TIMEOUT})")
     args = parser.parse_args()
     
+    if args.daemon:
+        try:
+            asyncio.run(serve_unix_socket(DAEMON_SOCKET, args.headless))
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+    
+    if not args.json:
+        parser.error("--json is required unless --daemon is given")
+    
+    # Reuse a warm browser if a daemon is running
+    try:
+        reply = daemon_socket.request({
+            "json_file": os.path.abspath(args.json),
+            "html_file": os.path.abspath(args.html) if args.html else None,
+            "client": args.client,
+            "output": os.path.abspath(args.output),
+            "time_window": args.time_window,
+            "concurrency": args.concurrency,
+        }, DAEMON_SOCKET, args.daemon_timeout)
+    except TimeoutError as e:
+        # The daemon still owns the task; capturing here would race it for the same files
+        print(f"❌ {e}")
+        return 1
+    if reply is not None and reply.get("ok"):
+        if not reply["found"]:
+            print("❌ No image URLs found in the JSON file")
+            return 1
+        for path in reply["paths"]:
+            print(f"✅ Image screenshot saved to: {path}")
+        return 0
+    if reply is not None:
+        print(f"⚠️ Daemon failed ({reply.get('error')}), processing locally")
+    
     # Extract image URLs from JSON, filtering by HTML file and time window
     image_urls = extract_image_urls_from_json(args.json, args.html, args.time_window)
     
@@ -276,7 +637,8 @@ def main():
         image_urls=image_urls,
         output_dir=args.output,
         client=args.client,
-        headless=args.headless
+        headless=args.headless,
+        max_concurrency=args.concurrency
     )
     
     return 0